@@ -32,22 +32,54 @@ Usage:
     )
 """
 
-from .config import settings
-from .database import DatabaseInterface, db
-from .cache import cache
-from .models import (
-    User,
-    Session,
-    TokenResponse,
-    SearchHistoryCreate,
-    SearchHistoryResponse,
-    SearchHistoryListResponse,
-    AuthStatus,
-    MessageResponse,
-)
-from .jwt_handler import JWTHandler
-from .oauth import GoogleOAuth
-from .dependencies import get_current_user, get_optional_user
+import importlib
+
+# Exported name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so importing one of them directly, e.g.
+# backend.auth.config from run.py, does not pull in the rest of the package
+# or parse the environment.
+_EXPORTS = {
+    "settings": "config",
+    "DatabaseInterface": "database",
+    "db": "database",
+    "get_db": "database",
+    "cache": "cache",
+    "User": "models",
+    "Session": "models",
+    "TokenResponse": "models",
+    "SearchHistoryCreate": "models",
+    "SearchHistoryResponse": "models",
+    "SearchHistoryBatchResponse": "models",
+    "SearchHistoryListResponse": "models",
+    "AuthStatus": "models",
+    "MessageResponse": "models",
+    "JWTHandler": "jwt_handler",
+    "GoogleOAuth": "oauth",
+    "get_current_user": "dependencies",
+    "get_optional_user": "dependencies",
+}
+
+
+def __getattr__(name: str):
+    """
+    Import an exported name from its submodule on first access (PEP 562).
+
+    Args:
+        name: Attribute being looked up on the package
+
+    Returns:
+        The exported object; it is cached in the package namespace
+
+    Raises:
+        AttributeError: If name is not one of the package exports
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Configuration
@@ -55,6 +87,7 @@ __all__ = [
     # Database
     "DatabaseInterface",
     "db",
+    "get_db",
     # Cache
     "cache",
     # Models
@@ -63,6 +96,7 @@ __all__ = [
     "TokenResponse",
     "SearchHistoryCreate",
     "SearchHistoryResponse",
+    "SearchHistoryBatchResponse",
     "SearchHistoryListResponse",
     "AuthStatus",
     "MessageResponse",
@@ -5,8 +5,8 @@ This module provides optional Redis caching for sessions and user data.
 Caching improves performance by reducing database queries.
 
 Cache types:
-- Session cache: User authentication data (TTL: 1 hour)
-- User cache: User profile data (TTL: 30 minutes)
+- Session cache: User authentication data, stored as a hash (TTL: 1 hour)
+- User cache: User profile data, stored as a hash (TTL: 30 minutes)
 - History cache: Search history list (TTL: 5 minutes)
 
 The cache is optional - if Redis is not available or disabled,
@@ -19,20 +19,153 @@ Usage:
     await cache.cache_session(session_id, user_data)
 
     # Get cached session (returns None if not cached)
-    user_data = await cache.get_cached_session(session_id)
+    user_data = await cache.get_cached_session(session_id, user_id)
 
     # Invalidate on logout
-    await cache.invalidate_session(session_id)
+    await cache.invalidate_session(session_id, user_id)
 """
 
+import asyncio
+import functools
 import json
 import logging
 from typing import Optional, Any
 
+from cachetools import TTLCache
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # redis not installed - the client is never created
+    class RedisError(Exception):
+        """Placeholder so the cache module imports without redis."""
+
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# In-process L1 cache sizing - kept short-lived because invalidations made
+# by other worker processes only reach Redis, not this process's L1
+_L1_MAXSIZE = 10_000
+_L1_TTL = 30
+
+# Cache payload (de)serializers - orjson is C-accelerated and emits bytes
+# directly, which redis-py writes to the socket without re-encoding. Without
+# orjson, fall back to one stdlib encoder bound at import time with compact
+# separators, instead of building a default encoder on every json.dumps call.
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    _SERIALIZE_ERRORS = (orjson.JSONDecodeError, orjson.JSONEncodeError)
+except ImportError:
+    _dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    _loads = json.loads
+    _SERIALIZE_ERRORS = (ValueError, TypeError)
+
+# History lists above these sizes (entries when encoding, payload bytes when
+# decoding) are (de)serialized in a worker thread so a large payload does not
+# stall other coroutines on the event loop
+_HISTORY_OFFLOAD_THRESHOLD = 100
+_HISTORY_OFFLOAD_BYTES = 64 * 1024
+
+
+# ==================== Key Schemes ====================
+# Every per-user key carries the ``{u:<user_id>}`` hash tag. Redis Cluster
+# hashes only the substring inside the braces, so a user's session, profile,
+# history and session index all map to the same slot and can share a
+# pipeline or MULTI/EXEC on a single shard.
+#
+# Keys are built as bytes from precomputed prefixes; the client runs with
+# decode_responses=False, so they go to the socket without re-encoding.
+
+_SESSION_PREFIX = b"session:"
+_USER_SESSIONS_PREFIX = b"user_sessions:"
+_USER_PREFIX = b"user:"
+_HISTORY_PREFIX = b"history_list:"
+
+
+def _user_tag(user_id: int) -> bytes:
+    """Cluster hash tag shared by all of a user's keys."""
+    return b"{u:%d}" % user_id
+
+
+def _session_key(user_id: int, session_id: str) -> bytes:
+    """Key holding one session's cached user data."""
+    return _SESSION_PREFIX + _user_tag(user_id) + b":" + session_id.encode("ascii")
+
+
+def _user_sessions_key(user_id: int) -> bytes:
+    """Key of the set indexing a user's active session IDs."""
+    return _USER_SESSIONS_PREFIX + _user_tag(user_id)
+
+
+def _user_key(user_id: int) -> bytes:
+    """Key holding a user's cached profile."""
+    return _USER_PREFIX + _user_tag(user_id)
+
+
+def _history_key(user_id: int) -> bytes:
+    """Key holding a user's cached search history list."""
+    return _HISTORY_PREFIX + _user_tag(user_id)
+
+
+def _queue_hash(pipe, key: bytes, data: dict, ttl: int) -> None:
+    """
+    Queue commands replacing ``key`` with ``data`` stored as a Redis HASH.
+
+    Each field value is serialized on its own so types (ints, None, nested
+    values) survive the round-trip, and single fields can be read with HGET.
+    The old hash is unlinked first so stale fields do not linger.
+
+    Args:
+        pipe: Redis pipeline to queue the commands on
+        key: Hash key
+        data: Record to store
+        ttl: Time-to-live in seconds
+    """
+    pipe.unlink(key)
+    pipe.hset(key, mapping={field: _dumps(value) for field, value in data.items()})
+    pipe.expire(key, ttl)
+
+
+def _decode_hash(raw: dict) -> dict:
+    """Decode an HGETALL reply written by _queue_hash back into a record."""
+    return {field.decode(): _loads(value) for field, value in raw.items()}
+
+
+# Failures the cache absorbs: Redis errors (connection, timeout, response)
+# and payloads that cannot be (de)serialized. Anything else - notably
+# asyncio.CancelledError - propagates to the caller.
+_CACHE_ERRORS = (RedisError, *_SERIALIZE_ERRORS)
+
+
+def _guard(default: Any):
+    """
+    Decorator for RedisCache methods that must never fail the request.
+
+    Returns ``default`` without calling the method when Redis is not
+    connected, and logs and returns ``default`` on cache errors.
+
+    Args:
+        default: Value returned when the cache is unavailable or fails
+
+    Returns:
+        Callable: Decorator wrapping an async RedisCache method
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            # Plain bool flag - avoids calling __bool__ on the client object
+            if not self.enabled:
+                return default
+            try:
+                return await func(self, *args, **kwargs)
+            except _CACHE_ERRORS as e:
+                logger.error(f"Cache {func.__name__} failed: {e}")
+                return default
+        return wrapper
+    return decorator
+
 
 class RedisCache:
     """
@@ -41,15 +174,22 @@ class RedisCache:
     This class wraps Redis operations with error handling.
     All methods return gracefully if Redis is unavailable.
 
+    Session and user lookups are fronted by a small per-process TTL cache
+    (L1) so repeated hits from the same worker skip the Redis round-trip.
+
     Attributes:
         client: Redis async client instance
-        enabled: Whether caching is enabled and connected
+        pool: Shared connection pool backing the client
+        enabled: True only while connected (set after a successful ping)
     """
 
     def __init__(self):
         """Initialize cache with disabled state until connect() is called."""
         self.client = None
-        self.enabled = settings.redis_enabled
+        self.pool = None
+        self.enabled = False
+        self._l1_session = TTLCache(maxsize=_L1_MAXSIZE, ttl=_L1_TTL)
+        self._l1_user = TTLCache(maxsize=_L1_MAXSIZE, ttl=_L1_TTL)
 
     async def connect(self) -> None:
         """
@@ -57,133 +197,221 @@ class RedisCache:
 
         Attempts to establish connection to Redis. If connection fails,
         caching is disabled but the application continues to work.
+
+        A single bounded pool (``settings.redis_pool_size`` connections) is
+        shared by all requests; when every connection is busy, callers wait
+        for one to be released instead of opening new sockets.
         """
-        if not self.enabled:
+        if not settings.redis_enabled:
             logger.info("Redis cache is disabled")
             return
 
         try:
             import redis.asyncio as redis
-            self.client = redis.from_url(
+            self.pool = redis.BlockingConnectionPool.from_url(
                 settings.get_redis_url(),
-                encoding="utf-8",
-                decode_responses=True
+                max_connections=settings.redis_pool_size,
+                decode_responses=False
             )
+            self.client = redis.Redis(connection_pool=self.pool)
             # Test connection with ping
             await self.client.ping()
-            logger.info("Redis cache connected")
+            self.enabled = True
+            # redis-py picks the hiredis C parser automatically when installed
+            from redis.utils import HIREDIS_AVAILABLE
+            parser = "hiredis" if HIREDIS_AVAILABLE else "pure-Python"
+            logger.info(f"Redis cache connected ({parser} parser)")
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}. Running without cache.")
+            if self.pool:
+                await self.pool.disconnect()
             self.client = None
+            self.pool = None
             self.enabled = False
 
     async def close(self) -> None:
-        """Close Redis connection gracefully."""
+        """Close Redis connection and its pool gracefully."""
+        self.enabled = False
         if self.client:
-            await self.client.close()
+            await self.client.aclose()
+        if self.pool:
+            await self.pool.disconnect()
 
     # ==================== Session Cache ====================
 
+    @_guard(False)
     async def cache_session(self, session_id: str, user_data: dict, ttl: int = 3600) -> bool:
         """
         Cache session data.
 
-        Stores user data associated with a session for fast lookup.
+        Stores user data associated with a session as a Redis HASH (one
+        field per attribute, see get_cached_session_field()) and records
+        the session ID in the owner's ``user_sessions`` index set so all of
+        a user's sessions can be invalidated without a SCAN.
 
         Args:
             session_id: Unique session identifier
-            user_data: User information to cache
+            user_data: User information to cache (must contain "user_id")
             ttl: Time-to-live in seconds (default: 1 hour)
 
         Returns:
             bool: True if cached successfully, False otherwise
         """
-        if not self.client:
-            return False
-        try:
-            key = f"session:{session_id}"
-            await self.client.setex(key, ttl, json.dumps(user_data))
-            return True
-        except Exception as e:
-            logger.error(f"Failed to cache session: {e}")
-            return False
-
-    async def get_cached_session(self, session_id: str) -> Optional[dict]:
+        key = _session_key(user_data["user_id"], session_id)
+        index_key = _user_sessions_key(user_data["user_id"])
+        async with self.client.pipeline(transaction=False) as pipe:
+            _queue_hash(pipe, key, user_data, ttl)
+            pipe.sadd(index_key, session_id)
+            pipe.expire(index_key, ttl)
+            await pipe.execute()
+        self._l1_session[session_id] = user_data
+        return True
+
+    @_guard(None)
+    async def get_cached_session(self, session_id: str, user_id: int) -> Optional[dict]:
         """
         Get cached session data.
 
         Args:
             session_id: Unique session identifier
+            user_id: Owner of the session (part of the cache key)
 
         Returns:
             dict: Cached user data if found
             None: If not cached or error
         """
-        if not self.client:
-            return None
-        try:
-            key = f"session:{session_id}"
-            data = await self.client.get(key)
-            return json.loads(data) if data else None
-        except Exception as e:
-            logger.error(f"Failed to get cached session: {e}")
+        cached = self._l1_session.get(session_id)
+        if cached is not None:
+            return cached
+        data = await self.client.hgetall(_session_key(user_id, session_id))
+        if not data:
             return None
+        user_data = _decode_hash(data)
+        self._l1_session[session_id] = user_data
+        return user_data
+
+    @_guard(None)
+    async def get_cached_session_field(self, session_id: str, user_id: int, field: str) -> Any:
+        """
+        Get a single field of cached session data.
+
+        Reads one hash field with HGET instead of fetching and decoding
+        the whole record.
+
+        Args:
+            session_id: Unique session identifier
+            user_id: Owner of the session (part of the cache key)
+            field: Name of the field to read (e.g. "email")
 
-    async def invalidate_session(self, session_id: str) -> bool:
+        Returns:
+            Any: Field value if cached
+            None: If the session or field is not cached
+        """
+        cached = self._l1_session.get(session_id)
+        if cached is not None:
+            return cached.get(field)
+        data = await self.client.hget(_session_key(user_id, session_id), field)
+        return _loads(data) if data is not None else None
+
+    @_guard(False)
+    async def invalidate_session(self, session_id: str, user_id: int) -> bool:
         """
         Remove session from cache (on logout).
 
+        Also removes the session ID from its owner's index set. Both keys
+        share the user's hash tag, so they are dropped in one pipeline.
+
         Args:
             session_id: Session to invalidate
+            user_id: Owner of the session
 
         Returns:
             bool: True if removed, False otherwise
         """
-        if not self.client:
-            return False
-        try:
-            key = f"session:{session_id}"
-            await self.client.delete(key)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to invalidate session: {e}")
-            return False
-
-    async def invalidate_user_sessions(self, user_id: int) -> int:
+        self._l1_session.pop(session_id, None)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.unlink(_session_key(user_id, session_id))
+            pipe.srem(_user_sessions_key(user_id), session_id)
+            await pipe.execute()
+        return True
+
+    @_guard(0)
+    async def invalidate_user_sessions(self, user_id: int, sweep: bool = False) -> int:
         """
         Remove all sessions for a user from cache.
 
-        Used when user logs out from all devices.
+        Used when user logs out from all devices. Session IDs are read
+        from the user's ``user_sessions`` index set, so the cost is
+        proportional to the user's own sessions rather than the keyspace.
+
+        With ``sweep=True`` the keyspace is also scanned for the user's
+        ``session:{u:<user_id>}:*`` keys, catching sessions missing from
+        the index (e.g. if the index expired first). The session ID is
+        taken from the key suffix, so no value is read or decoded.
 
         Args:
             user_id: User whose sessions to invalidate
+            sweep: Also SCAN for session keys not in the index
 
         Returns:
             int: Number of sessions invalidated
         """
-        if not self.client:
-            return 0
-        try:
-            pattern = f"session:*"
-            count = 0
-            # Scan all session keys and check user_id
-            async for key in self.client.scan_iter(pattern):
-                data = await self.client.get(key)
-                if data:
-                    session_data = json.loads(data)
-                    if session_data.get("user_id") == user_id:
-                        await self.client.delete(key)
-                        count += 1
-            return count
-        except Exception as e:
-            logger.error(f"Failed to invalidate user sessions: {e}")
+        index_key = _user_sessions_key(user_id)
+        session_ids = {session_id.decode("ascii") for session_id in await self.client.smembers(index_key)}
+        if sweep:
+            prefix_len = len(_session_key(user_id, ""))
+            async for key in self.client.scan_iter(match=_session_key(user_id, "*"),
+                                                   count=settings.redis_scan_count):
+                session_ids.add(key[prefix_len:].decode("ascii"))
+        if not session_ids:
             return 0
+        for session_id in session_ids:
+            self._l1_session.pop(session_id, None)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.unlink(_session_key(user_id, session_id))
+            # Drop the index set in the same round-trip; it may already be
+            # gone (the case sweep exists for), so it is not counted
+            pipe.unlink(index_key)
+            results = await pipe.execute()
+        return sum(results[:-1])
+
+    @_guard(False)
+    async def cache_login_bundle(self, session_id: str, user_id: int, user_data: dict,
+                                 session_ttl: int = 3600, user_ttl: int = 1800) -> bool:
+        """
+        Cache a new login's session and user profile in one round-trip.
+
+        Equivalent to cache_session() followed by cache_user(), but all
+        writes are queued on a single pipeline.
+
+        Args:
+            session_id: Newly created session ID
+            user_id: User's database ID
+            user_data: User profile to cache
+            session_ttl: Session time-to-live in seconds (default: 1 hour)
+            user_ttl: User time-to-live in seconds (default: 30 minutes)
+
+        Returns:
+            bool: True if cached successfully
+        """
+        index_key = _user_sessions_key(user_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            _queue_hash(pipe, _session_key(user_id, session_id), {**user_data, "user_id": user_id}, session_ttl)
+            pipe.sadd(index_key, session_id)
+            pipe.expire(index_key, session_ttl)
+            _queue_hash(pipe, _user_key(user_id), user_data, user_ttl)
+            await pipe.execute()
+        self._l1_session[session_id] = {**user_data, "user_id": user_id}
+        self._l1_user[user_id] = user_data
+        return True
 
     # ==================== User Cache ====================
 
+    @_guard(False)
     async def cache_user(self, user_id: int, user_data: dict, ttl: int = 1800) -> bool:
         """
-        Cache user profile data.
+        Cache user profile data as a Redis HASH.
 
         Args:
             user_id: User's database ID
@@ -193,16 +421,13 @@ class RedisCache:
         Returns:
             bool: True if cached successfully
         """
-        if not self.client:
-            return False
-        try:
-            key = f"user:{user_id}"
-            await self.client.setex(key, ttl, json.dumps(user_data))
-            return True
-        except Exception as e:
-            logger.error(f"Failed to cache user: {e}")
-            return False
+        async with self.client.pipeline(transaction=False) as pipe:
+            _queue_hash(pipe, _user_key(user_id), user_data, ttl)
+            await pipe.execute()
+        self._l1_user[user_id] = user_data
+        return True
 
+    @_guard(None)
     async def get_cached_user(self, user_id: int) -> Optional[dict]:
         """
         Get cached user profile.
@@ -214,16 +439,17 @@ class RedisCache:
             dict: Cached user data if found
             None: If not cached
         """
-        if not self.client:
-            return None
-        try:
-            key = f"user:{user_id}"
-            data = await self.client.get(key)
-            return json.loads(data) if data else None
-        except Exception as e:
-            logger.error(f"Failed to get cached user: {e}")
+        cached = self._l1_user.get(user_id)
+        if cached is not None:
+            return cached
+        data = await self.client.hgetall(_user_key(user_id))
+        if not data:
             return None
+        user_data = _decode_hash(data)
+        self._l1_user[user_id] = user_data
+        return user_data
 
+    @_guard(False)
     async def invalidate_user(self, user_id: int) -> bool:
         """
         Remove user from cache.
@@ -236,22 +462,21 @@ class RedisCache:
         Returns:
             bool: True if removed
         """
-        if not self.client:
-            return False
-        try:
-            key = f"user:{user_id}"
-            await self.client.delete(key)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to invalidate user: {e}")
-            return False
+        self._l1_user.pop(user_id, None)
+        key = _user_key(user_id)
+        await self.client.unlink(key)
+        return True
 
     # ==================== Search History Cache ====================
 
+    @_guard(False)
     async def cache_history_list(self, user_id: int, history: list, ttl: int = 300) -> bool:
         """
         Cache user's search history list.
 
+        Lists longer than ``_HISTORY_OFFLOAD_THRESHOLD`` entries are encoded
+        in a worker thread to keep the event loop responsive.
+
         Args:
             user_id: User's database ID
             history: List of search history entries
@@ -260,20 +485,22 @@ class RedisCache:
         Returns:
             bool: True if cached successfully
         """
-        if not self.client:
-            return False
-        try:
-            key = f"history_list:{user_id}"
-            await self.client.setex(key, ttl, json.dumps(history))
-            return True
-        except Exception as e:
-            logger.error(f"Failed to cache history list: {e}")
-            return False
-
+        key = _history_key(user_id)
+        if len(history) > _HISTORY_OFFLOAD_THRESHOLD:
+            data = await asyncio.to_thread(_dumps, history)
+        else:
+            data = _dumps(history)
+        await self.client.setex(key, ttl, data)
+        return True
+
+    @_guard(None)
     async def get_cached_history_list(self, user_id: int) -> Optional[list]:
         """
         Get cached search history list.
 
+        Large payloads are decoded in a worker thread. The entry count is
+        unknown before decoding, so the raw payload size is used instead.
+
         Args:
             user_id: User's database ID
 
@@ -281,16 +508,15 @@ class RedisCache:
             list: Cached history if found
             None: If not cached
         """
-        if not self.client:
-            return None
-        try:
-            key = f"history_list:{user_id}"
-            data = await self.client.get(key)
-            return json.loads(data) if data else None
-        except Exception as e:
-            logger.error(f"Failed to get cached history list: {e}")
+        key = _history_key(user_id)
+        data = await self.client.get(key)
+        if not data:
             return None
+        if len(data) > _HISTORY_OFFLOAD_BYTES:
+            return await asyncio.to_thread(_loads, data)
+        return _loads(data)
 
+    @_guard(False)
     async def invalidate_history_list(self, user_id: int) -> bool:
         """
         Remove history list from cache.
@@ -303,18 +529,13 @@ class RedisCache:
         Returns:
             bool: True if removed
         """
-        if not self.client:
-            return False
-        try:
-            key = f"history_list:{user_id}"
-            await self.client.delete(key)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to invalidate history list: {e}")
-            return False
+        key = _history_key(user_id)
+        await self.client.unlink(key)
+        return True
 
     # ==================== Generic Cache Operations ====================
 
+    @_guard(None)
     async def get(self, key: str) -> Optional[Any]:
         """
         Get any value from cache by key.
@@ -326,15 +547,10 @@ class RedisCache:
             Any: Cached value (JSON decoded)
             None: If not found
         """
-        if not self.client:
-            return None
-        try:
-            data = await self.client.get(key)
-            return json.loads(data) if data else None
-        except Exception as e:
-            logger.error(f"Cache get error: {e}")
-            return None
+        data = await self.client.get(key)
+        return _loads(data) if data else None
 
+    @_guard(False)
     async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """
         Set any value in cache.
@@ -347,33 +563,79 @@ class RedisCache:
         Returns:
             bool: True if set successfully
         """
-        if not self.client:
-            return False
-        try:
-            await self.client.setex(key, ttl, json.dumps(value))
-            return True
-        except Exception as e:
-            logger.error(f"Cache set error: {e}")
-            return False
+        await self.client.setex(key, ttl, _dumps(value))
+        return True
 
+    @_guard(False)
     async def delete(self, key: str) -> bool:
         """
         Delete value from cache.
 
+        Uses UNLINK: the key disappears immediately, but Redis frees its
+        memory in a background thread instead of blocking on large values.
+
         Args:
             key: Cache key to delete
 
         Returns:
             bool: True if deleted
         """
-        if not self.client:
-            return False
-        try:
-            await self.client.delete(key)
-            return True
-        except Exception as e:
-            logger.error(f"Cache delete error: {e}")
-            return False
+        await self.client.unlink(key)
+        return True
+
+    @_guard(0)
+    async def invalidate_many(self, keys: list[str | bytes], batch_size: int = 500) -> int:
+        """
+        Delete many keys using pipelined batches.
+
+        Each batch of deletes is sent in a single round-trip instead of
+        one round-trip per key. Keys are removed with UNLINK so memory is
+        reclaimed off Redis's main thread.
+
+        Args:
+            keys: Cache keys to delete
+            batch_size: Number of keys per pipeline execution
+
+        Returns:
+            int: Number of keys actually deleted
+        """
+        if not keys:
+            return 0
+        count = 0
+        for start in range(0, len(keys), batch_size):
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys[start:start + batch_size]:
+                    pipe.unlink(key)
+                count += sum(await pipe.execute())
+        return count
+
+    @_guard(0)
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """
+        Delete all keys matching a glob pattern.
+
+        Walks the keyspace with SCAN using ``settings.redis_scan_count`` as
+        the COUNT hint. The redis-py default of 10 keys per step makes large
+        scans take thousands of round-trips; a larger hint trades slightly
+        longer individual SCAN calls on the server for far fewer round-trips.
+        Matching keys are deleted in pipelined batches.
+
+        Args:
+            pattern: Glob-style key pattern (e.g. "history_list:*")
+
+        Returns:
+            int: Number of keys deleted
+        """
+        count = 0
+        batch = []
+        async for key in self.client.scan_iter(match=pattern, count=settings.redis_scan_count):
+            batch.append(key)
+            if len(batch) >= settings.redis_scan_count:
+                count += await self.invalidate_many(batch)
+                batch = []
+        if batch:
+            count += await self.invalidate_many(batch)
+        return count
 
 
 # Global cache instance - connect() called during app startup
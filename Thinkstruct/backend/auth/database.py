@@ -25,6 +25,7 @@ Usage:
     # Session operations
     session_id = await db.create_session(user_id)
     session = await db.get_session(session_id)
+    bundle = await db.get_session_with_user(session_id)
     await db.revoke_session(session_id)
 
     # Search history
@@ -32,19 +33,124 @@ Usage:
     history = await db.get_search_history(user_id)
 """
 
-import json
+import asyncio
+import functools
 import logging
 import os
+import secrets
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Optional, List
-import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Final, Optional, List, Tuple
+
+import orjson
+
+# Database drivers are optional: only the one matching DATABASE_TYPE has to
+# be installed, and create_database() reports a missing one up front
+try:
+    import aiosqlite
+except ImportError:  # PostgreSQL-only deployment
+    aiosqlite = None
+
+try:
+    import asyncpg
+except ImportError:  # SQLite-only deployment
+    asyncpg = None
 
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Hot-Path SQL Statements
+# ============================================================================
+# Queries run on every authenticated request or history page view, built
+# once at import. The Postgres variants are also prepared per pooled
+# connection.
+
+# Columns selected by get_session_with_user(); the session ID is aliased so
+# it does not collide with the user's id column
+SESSION_USER_COLUMNS: Final[str] = """
+    s.id AS session_id, s.user_id, s.expires_at, s.is_revoked,
+    u.id, u.google_id, u.email, u.name, u.picture_url, u.created_at, u.last_login_at
+"""
+
+# Columns read and returned for a user row; listed explicitly rather than
+# SELECT * so a column added later is not shipped on every auth lookup
+USER_COLUMNS: Final[str] = "id, google_id, email, name, picture_url, created_at, last_login_at"
+
+_SQL_GET_USER_BY_GOOGLE_ID_SQLITE: Final[str] = f"SELECT {USER_COLUMNS} FROM users WHERE google_id = ?"
+_SQL_GET_USER_BY_GOOGLE_ID_PG: Final[str] = f"SELECT {USER_COLUMNS} FROM users WHERE google_id = $1"
+
+_SQL_GET_USER_BY_ID_SQLITE: Final[str] = f"SELECT {USER_COLUMNS} FROM users WHERE id = ?"
+_SQL_GET_USER_BY_ID_PG: Final[str] = f"SELECT {USER_COLUMNS} FROM users WHERE id = $1"
+
+_SQL_GET_SESSION_SQLITE: Final[str] = """SELECT id, user_id, expires_at, is_revoked FROM sessions
+    WHERE id = ? AND is_revoked = FALSE AND expires_at > ?"""
+_SQL_GET_SESSION_PG: Final[str] = """SELECT id, user_id, expires_at, is_revoked FROM sessions
+    WHERE id = $1 AND is_revoked = FALSE AND expires_at > $2"""
+
+_SQL_GET_SESSION_WITH_USER_SQLITE: Final[str] = f"""SELECT {SESSION_USER_COLUMNS}
+    FROM sessions s JOIN users u ON u.id = s.user_id
+    WHERE s.id = ? AND s.is_revoked = FALSE AND s.expires_at > ?"""
+_SQL_GET_SESSION_WITH_USER_PG: Final[str] = f"""SELECT {SESSION_USER_COLUMNS}
+    FROM sessions s JOIN users u ON u.id = s.user_id
+    WHERE s.id = $1 AND s.is_revoked = FALSE AND s.expires_at > $2"""
+
+# Batched variant for get_sessions_with_users() (SQLite builds its IN list per call)
+_SQL_GET_SESSIONS_WITH_USERS_PG: Final[str] = f"""SELECT {SESSION_USER_COLUMNS}
+    FROM sessions s JOIN users u ON u.id = s.user_id
+    WHERE s.id = ANY($1::text[]) AND s.is_revoked = FALSE AND s.expires_at > $2"""
+
+# Search history columns for list views that only show metadata: everything
+# except results_data, which can run to megabytes per row
+HISTORY_LIST_COLUMNS: Final[str] = "id, user_id, scenario, query_data, result_count, search_time_ms, created_at"
+# ...and for full entries, which do need the results
+HISTORY_ENTRY_COLUMNS: Final[str] = f"{HISTORY_LIST_COLUMNS}, results_data"
+
+_SQL_HISTORY_LIST_SQLITE: Final[str] = f"""SELECT {HISTORY_LIST_COLUMNS} FROM search_history
+    WHERE user_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?"""
+_SQL_HISTORY_LIST_PG: Final[str] = f"""SELECT {HISTORY_LIST_COLUMNS} FROM search_history
+    WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2 OFFSET $3"""
+
+_SQL_HISTORY_FULL_SQLITE: Final[str] = f"""SELECT {HISTORY_ENTRY_COLUMNS} FROM search_history
+    WHERE user_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?"""
+_SQL_HISTORY_FULL_PG: Final[str] = f"""SELECT {HISTORY_ENTRY_COLUMNS} FROM search_history
+    WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2 OFFSET $3"""
+
+_SQL_GET_HISTORY_ENTRY_SQLITE: Final[str] = f"SELECT {HISTORY_ENTRY_COLUMNS} FROM search_history WHERE id = ? AND user_id = ?"
+_SQL_GET_HISTORY_ENTRY_PG: Final[str] = f"SELECT {HISTORY_ENTRY_COLUMNS} FROM search_history WHERE id = $1 AND user_id = $2"
+
+# Hot-path writes (Postgres only; SQLite inlines its own variants)
+_SQL_CREATE_SESSION_PG: Final[str] = "INSERT INTO sessions (id, user_id, expires_at) VALUES ($1, $2, $3)"
+_SQL_UPDATE_USER_LOGIN_PG: Final[str] = "UPDATE users SET last_login_at = NOW() AT TIME ZONE 'UTC' WHERE id = $1"
+_SQL_REVOKE_SESSION_PG: Final[str] = "UPDATE sessions SET is_revoked = TRUE WHERE id = $1"
+_SQL_SAVE_HISTORY_PG: Final[str] = """INSERT INTO search_history
+    (user_id, scenario, query_data, results_data, result_count, search_time_ms, created_at)
+    VALUES ($1, $2, $3, $4, $5, $6, NOW()) RETURNING id, created_at"""
+
+
+def _split_session_user(item: dict) -> dict:
+    """
+    Split a joined session/user row into separate session and user dicts.
+
+    Args:
+        item: Row selected with SESSION_USER_COLUMNS
+
+    Returns:
+        dict: {"session": {...}, "user": {...}}
+    """
+    session = {
+        "id": item.pop("session_id"),
+        "user_id": item.pop("user_id"),
+        "expires_at": item.pop("expires_at"),
+        "is_revoked": item.pop("is_revoked"),
+    }
+    return {"session": session, "user": item}
+
+
 # ============================================================================
 # Abstract Database Interface
 # ============================================================================
@@ -56,11 +162,57 @@ class DatabaseInterface(ABC):
     Defines the contract that all database implementations must follow.
     This allows switching between SQLite and PostgreSQL without
     changing the application code.
+
+    Also provides the background task that periodically purges expired
+    sessions; implementations start it from init_db() (unless
+    settings.run_session_cleanup is off) and stop it in close().
     """
 
+    # Maximum rows removed per DELETE statement by chunked deletes, so a
+    # large purge never holds locks long enough to stall live writes
+    DELETE_BATCH_SIZE = 1000
+    # Seconds between background expired-session cleanups
+    SESSION_CLEANUP_INTERVAL = 3600
+
+    _cleanup_task: Optional[asyncio.Task] = None
+
+    def start_session_cleanup(self) -> None:
+        """Start the background expired-session cleanup task if not running."""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def stop_session_cleanup(self) -> None:
+        """Cancel the background cleanup task and wait for it to finish."""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
+
+    async def _cleanup_loop(self) -> None:
+        """Purge expired sessions every SESSION_CLEANUP_INTERVAL seconds."""
+        while True:
+            try:
+                deleted = await self.cleanup_expired_sessions()
+                if deleted:
+                    logger.info(f"Cleaned up {deleted} expired sessions")
+            except Exception as e:
+                logger.error(f"Expired session cleanup failed: {e}")
+            await asyncio.sleep(self.SESSION_CLEANUP_INTERVAL)
+
+    @abstractmethod
+    async def migrate(self) -> None:
+        """Create tables and indexes if missing and apply schema migrations."""
+        pass
+
     @abstractmethod
     async def init_db(self) -> None:
-        """Initialize database schema (create tables if not exist)."""
+        """
+        Open connections, running migrate() first unless settings.run_migrations
+        is off, and start the session sweep unless settings.run_session_cleanup is.
+        """
         pass
 
     @abstractmethod
@@ -68,6 +220,11 @@ class DatabaseInterface(ABC):
         """Close database connections gracefully."""
         pass
 
+    @abstractmethod
+    def pool_stats(self) -> dict:
+        """Report connection pool size and usage (for the /api/health/pool endpoint)."""
+        pass
+
     # ==================== User Operations ====================
 
     @abstractmethod
@@ -92,7 +249,7 @@ class DatabaseInterface(ABC):
 
     @abstractmethod
     async def upsert_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None) -> dict:
-        """Create user if not exists, or update login time if exists."""
+        """Create user if not exists, or update login time and profile if exists."""
         pass
 
     # ==================== Session Operations ====================
@@ -102,11 +259,33 @@ class DatabaseInterface(ABC):
         """Create a new session and return session ID."""
         pass
 
+    @abstractmethod
+    async def login_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None,
+                         expires_hours: int = 24) -> Tuple[dict, str]:
+        """Upsert the user and create a session on one connection; return (user, session_id)."""
+        pass
+
     @abstractmethod
     async def get_session(self, session_id: str) -> Optional[dict]:
         """Get session if valid (not expired, not revoked)."""
         pass
 
+    @abstractmethod
+    async def get_session_with_user(self, session_id: str) -> Optional[dict]:
+        """Get a valid session and its user in one query as {"session": ..., "user": ...}."""
+        pass
+
+    @abstractmethod
+    async def get_sessions_with_users(self, session_ids: List[str]) -> dict:
+        """
+        Get several valid sessions and their users in one query.
+
+        Returns a dict mapping each valid session ID to the same
+        {"session": ..., "user": ...} bundle get_session_with_user returns;
+        invalid or unknown IDs are absent.
+        """
+        pass
+
     @abstractmethod
     async def revoke_session(self, session_id: str) -> None:
         """Revoke a session (logout)."""
@@ -119,7 +298,7 @@ class DatabaseInterface(ABC):
 
     @abstractmethod
     async def cleanup_expired_sessions(self) -> int:
-        """Delete expired sessions and return count deleted."""
+        """Delete expired sessions in DELETE_BATCH_SIZE chunks and return count deleted."""
         pass
 
     # ==================== Search History Operations ====================
@@ -132,8 +311,24 @@ class DatabaseInterface(ABC):
         pass
 
     @abstractmethod
-    async def get_search_history(self, user_id: int, limit: int = 50, offset: int = 0) -> List[dict]:
-        """Get user's search history (most recent first)."""
+    async def save_search_history_bulk(self, entries: List[tuple]) -> List[int]:
+        """
+        Save many searches in one round-trip and return their entry IDs.
+
+        Each entry is a (user_id, scenario, query_data, results_data,
+        result_count, search_time_ms) tuple; IDs are returned in order.
+        """
+        pass
+
+    @abstractmethod
+    async def get_search_history(self, user_id: int, limit: int = 50, offset: int = 0,
+                                  include_results: bool = False) -> List[dict]:
+        """
+        Get user's search history (most recent first).
+
+        results_data is only fetched when include_results is True; otherwise
+        entries carry metadata and query_data alone.
+        """
         pass
 
     @abstractmethod
@@ -148,7 +343,7 @@ class DatabaseInterface(ABC):
 
     @abstractmethod
     async def clear_user_history(self, user_id: int) -> int:
-        """Delete all history for a user and return count deleted."""
+        """Delete all history for a user in DELETE_BATCH_SIZE chunks and return count deleted."""
         pass
 
 
@@ -156,12 +351,39 @@ class DatabaseInterface(ABC):
 # SQLite Implementation
 # ============================================================================
 
+# Current time as INTEGER epoch milliseconds, evaluated by SQLite. User and
+# history timestamps are stored in this form; inserts stamp it explicitly
+# because databases created before the switch keep a CURRENT_TIMESTAMP
+# column default.
+_SQLITE_NOW_MS: Final[str] = "CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER)"
+
+
+def _epoch_ms_to_iso(value):
+    """
+    Format an epoch-milliseconds timestamp as a naive UTC ISO-8601 string.
+
+    Args:
+        value: Epoch milliseconds (values that are not ints pass through)
+
+    Returns:
+        str: e.g. "2024-01-31T12:00:00.000", matching the PostgreSQL output
+    """
+    if not isinstance(value, int):
+        return value
+    return datetime.fromtimestamp(value / 1000, timezone.utc).replace(tzinfo=None).isoformat(timespec="milliseconds")
+
+
 class SQLiteDatabase(DatabaseInterface):
     """
     SQLite database implementation.
 
-    Uses aiosqlite for async operations. Connections are created
-    per-operation to avoid threading issues.
+    Uses aiosqlite for async operations. A small LIFO pool of long-lived
+    connections (WAL mode, autocommit) serves reads, so they run
+    concurrently and nothing pays the thread-start, file-open and
+    cold-page-cache cost of a new connection per query. All writes go
+    through one dedicated writer connection behind an asyncio.Lock:
+    SQLite admits a single writer at a time anyway, and queueing writes
+    in-process avoids SQLITE_BUSY waits between pooled connections.
 
     Best for: Development, testing, single-user scenarios.
     """
@@ -174,14 +396,15 @@ class SQLiteDatabase(DatabaseInterface):
         email TEXT UNIQUE NOT NULL,
         name TEXT NOT NULL,
         picture_url TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        last_login_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        -- Epoch milliseconds (see _SQLITE_NOW_MS)
+        created_at INTEGER DEFAULT (CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER)),
+        last_login_at INTEGER DEFAULT (CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER))
     );
 
     CREATE TABLE IF NOT EXISTS sessions (
         id TEXT PRIMARY KEY,
         user_id INTEGER NOT NULL,
-        expires_at TIMESTAMP NOT NULL,
+        expires_at INTEGER NOT NULL,  -- Unix epoch seconds
         is_revoked BOOLEAN DEFAULT FALSE,
         FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
     );
@@ -194,35 +417,152 @@ class SQLiteDatabase(DatabaseInterface):
         results_data TEXT,
         result_count INTEGER DEFAULT 0,
         search_time_ms REAL DEFAULT 0,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        created_at INTEGER DEFAULT (CAST(ROUND((julianday('now') - 2440587.5) * 86400000) AS INTEGER)),
         FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
     );
 
     CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
     CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at);
-    CREATE INDEX IF NOT EXISTS idx_search_history_user_id ON search_history(user_id);
-    CREATE INDEX IF NOT EXISTS idx_search_history_created_at ON search_history(created_at);
+
+    -- Partial covering index for live sessions: get_session_with_user reads
+    -- the session side of its JOIN from the index alone, and revoked rows
+    -- never enter it
+    CREATE INDEX IF NOT EXISTS idx_sessions_active
+        ON sessions(id, expires_at, user_id, is_revoked) WHERE is_revoked = FALSE;
+
+    -- History listing walks this index in order and stops at LIMIT;
+    -- it supersedes the former single-column indexes
+    CREATE INDEX IF NOT EXISTS idx_search_history_user_created ON search_history(user_id, created_at DESC);
+    DROP INDEX IF EXISTS idx_search_history_user_id;
+    DROP INDEX IF EXISTS idx_search_history_created_at;
+    """
+
+    # Connection tuning applied once to each connection when opened:
+    # WAL lets readers and the writer proceed concurrently, synchronous=NORMAL
+    # skips the fsync on every commit (still durable across app crashes in
+    # WAL mode), temp tables/sorts stay in RAM, reads go through a 256 MB
+    # memory map, and the page cache is 64 MB. busy_timeout makes a
+    # connection wait for a write from another process (e.g. a second
+    # worker) to finish instead of failing with SQLITE_BUSY.
+    PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA busy_timeout=5000;
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    # Timestamp columns stored as INTEGER epoch milliseconds
+    EPOCH_MS_COLUMNS = (
+        ("users", "created_at"),
+        ("users", "last_login_at"),
+        ("search_history", "created_at"),
+    )
+    # ...and converted back to ISO strings on read, like PostgreSQL's rows
+    DATETIME_COLUMNS = frozenset({"created_at", "last_login_at"})
+
+    def __init__(self, db_path: Optional[str] = None, pool_size: Optional[int] = None):
         """
         Initialize SQLite database.
 
         Args:
             db_path: Path to database file (defaults to settings)
+            pool_size: Number of pooled connections (defaults to settings)
         """
         self.db_path = db_path or settings.database_path
+        self.pool_size = max(1, pool_size or settings.sqlite_pool_size)
         # Ensure directory exists
         os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._pool: Optional[asyncio.LifoQueue] = None
+        self._pool_lock = asyncio.Lock()
+        self._writer = None
+        self._writer_lock = asyncio.Lock()
 
-    async def _get_connection(self):
-        """Get a new database connection."""
-        import aiosqlite
-        return await aiosqlite.connect(self.db_path)
+    async def _connect(self):
+        """
+        Open one tuned connection.
 
-    async def init_db(self) -> None:
-        """Create tables and indexes if they don't exist."""
-        conn = await self._get_connection()
+        Returns:
+            aiosqlite.Connection: Autocommit connection with row_factory and PRAGMAS applied
+        """
+        conn = await aiosqlite.connect(self.db_path, isolation_level=None)
+        conn.row_factory = aiosqlite.Row
+        await conn.executescript(self.PRAGMAS)
+        return conn
+
+    async def _open_pool(self) -> asyncio.LifoQueue:
+        """
+        Open pool_size connections and queue them for reuse.
+
+        Each connection runs in autocommit mode with row_factory and
+        PRAGMAS applied once. Connections are opened one after another so
+        the first one switches the database to WAL before the rest attach.
+
+        Returns:
+            asyncio.LifoQueue: Queue holding every idle connection
+        """
+        pool = asyncio.LifoQueue(maxsize=self.pool_size)
+        for _ in range(self.pool_size):
+            pool.put_nowait(await self._connect())
+        return pool
+
+    async def _get_pool(self) -> asyncio.LifoQueue:
+        """
+        Return the read pool, opening it on first call.
+
+        Returns:
+            asyncio.LifoQueue: Queue holding every idle pooled connection
+        """
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await self._open_pool()
+        return self._pool
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Borrow a pooled connection for the duration of the block.
+
+        The pool is opened lazily on first use. LIFO order hands out the
+        most recently used connection, whose page cache is warmest; callers
+        wait when every connection is busy.
+
+        Yields:
+            aiosqlite.Connection: A connection owned by the caller until exit
+        """
+        pool = self._pool or await self._get_pool()
+        conn = await pool.get()
+        try:
+            yield conn
+        finally:
+            pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def writer(self):
+        """
+        Hold the writer connection exclusively for the duration of the block.
+
+        The connection is opened lazily on first use. Writers queue on
+        _writer_lock, so keep the block to the write itself.
+
+        Yields:
+            aiosqlite.Connection: The single writer connection
+        """
+        async with self._writer_lock:
+            if self._writer is None:
+                self._writer = await self._connect()
+            yield self._writer
+
+    async def migrate(self) -> None:
+        """
+        Create tables and indexes if they don't exist and migrate old data.
+
+        Uses its own short-lived connection, so it can run in a process
+        that never serves requests (see run.py).
+        """
+        conn = await self._connect()
         try:
             await conn.executescript(self.SCHEMA)
             # Migration: add results_data column if missing (for old databases)
@@ -230,229 +570,394 @@ class SQLiteDatabase(DatabaseInterface):
                 await conn.execute("ALTER TABLE search_history ADD COLUMN results_data TEXT")
             except Exception:
                 pass  # Column already exists
-            await conn.commit()
+            # Migration: convert ISO-string session expiries to epoch seconds
+            await conn.execute(
+                """UPDATE sessions SET expires_at = CAST(strftime('%s', expires_at) AS INTEGER)
+                   WHERE typeof(expires_at) = 'text'"""
+            )
+            # Migration: convert text user/history timestamps to epoch milliseconds
+            for table, column in self.EPOCH_MS_COLUMNS:
+                await conn.execute(
+                    f"""UPDATE {table}
+                        SET {column} = CAST(ROUND((julianday({column}) - 2440587.5) * 86400000) AS INTEGER)
+                        WHERE typeof({column}) = 'text'"""
+                )
         finally:
             await conn.close()
 
+    async def init_db(self) -> None:
+        """Migrate the schema (unless disabled), then open the read pool."""
+        if settings.run_migrations:
+            await self.migrate()
+        # Open the read pool now so connection errors surface at startup
+        await self._get_pool()
+        if settings.run_session_cleanup:
+            self.start_session_cleanup()
+
     async def close(self) -> None:
-        """SQLite connections are closed per-operation."""
-        pass
+        """Stop background cleanup, then close the writer and every pooled connection."""
+        await self.stop_session_cleanup()
+        async with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                await writer.close()
+        async with self._pool_lock:
+            pool, self._pool = self._pool, None
+            if pool is not None:
+                # get() waits for connections still in use to be returned
+                for _ in range(self.pool_size):
+                    conn = await pool.get()
+                    await conn.close()
+
+    def pool_stats(self) -> dict:
+        """
+        Report read pool usage and whether the writer connection is open.
+
+        Returns:
+            dict: backend, size, idle, in_use, writer_open, writer_busy
+        """
+        idle = self._pool.qsize() if self._pool is not None else 0
+        size = self.pool_size if self._pool is not None else 0
+        return {
+            "backend": "sqlite",
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "writer_open": self._writer is not None,
+            "writer_busy": self._writer_lock.locked(),
+        }
+
+    def _convert_row(self, row) -> dict:
+        """Convert an aiosqlite row to a dict, formatting epoch-ms timestamps as ISO strings."""
+        datetime_columns = self.DATETIME_COLUMNS
+        return {
+            key: _epoch_ms_to_iso(value) if key in datetime_columns else value
+            for key, value in zip(row.keys(), row)
+        }
 
     async def get_user_by_google_id(self, google_id: str) -> Optional[dict]:
         """Find user by Google account ID."""
-        import aiosqlite
-        conn = await self._get_connection()
-        try:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute("SELECT * FROM users WHERE google_id = ?", (google_id,))
+        async with self.acquire() as conn:
+            cursor = await conn.execute(_SQL_GET_USER_BY_GOOGLE_ID_SQLITE, (google_id,))
             row = await cursor.fetchone()
-            return dict(row) if row else None
-        finally:
-            await conn.close()
+            return self._convert_row(row) if row else None
 
     async def get_user_by_id(self, user_id: int) -> Optional[dict]:
         """Find user by database ID."""
-        import aiosqlite
-        conn = await self._get_connection()
-        try:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute("SELECT * FROM users WHERE id = ?", (user_id,))
+        async with self.acquire() as conn:
+            cursor = await conn.execute(_SQL_GET_USER_BY_ID_SQLITE, (user_id,))
             row = await cursor.fetchone()
-            return dict(row) if row else None
-        finally:
-            await conn.close()
+            return self._convert_row(row) if row else None
 
     async def create_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None) -> dict:
-        """Create a new user and return the user dict."""
-        conn = await self._get_connection()
-        try:
+        """Create a new user and return the user dict (INSERT ... RETURNING, no read-back query)."""
+        async with self.writer() as conn:
             cursor = await conn.execute(
-                "INSERT INTO users (google_id, email, name, picture_url) VALUES (?, ?, ?, ?)",
+                f"""INSERT INTO users (google_id, email, name, picture_url, created_at, last_login_at)
+                    VALUES (?, ?, ?, ?, {_SQLITE_NOW_MS}, {_SQLITE_NOW_MS})
+                    RETURNING {USER_COLUMNS}""",
                 (google_id, email, name, picture_url)
             )
-            await conn.commit()
-            user_id = cursor.lastrowid
-        finally:
-            await conn.close()
-        return await self.get_user_by_id(user_id)
+            row = await cursor.fetchone()
+            # Finish the statement so the autocommit write is released
+            await cursor.close()
+            return self._convert_row(row)
 
     async def update_user_login(self, user_id: int) -> None:
         """Update last_login_at timestamp."""
-        conn = await self._get_connection()
-        try:
+        async with self.writer() as conn:
             await conn.execute(
-                "UPDATE users SET last_login_at = ? WHERE id = ?",
-                (datetime.utcnow().isoformat(), user_id)
+                f"UPDATE users SET last_login_at = {_SQLITE_NOW_MS} WHERE id = ?",
+                (user_id,)
             )
-            await conn.commit()
-        finally:
-            await conn.close()
 
     async def upsert_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None) -> dict:
-        """Create or update user on login."""
-        user = await self.get_user_by_google_id(google_id)
-        if user:
-            # Existing user - update login time
-            await self.update_user_login(user["id"])
-            return await self.get_user_by_id(user["id"])
-        # New user - create account
-        return await self.create_user(google_id, email, name, picture_url)
+        """
+        Create or update user on login.
+
+        A single INSERT ... ON CONFLICT ... RETURNING statement creates the
+        user or refreshes login time and profile fields, avoiding the
+        check-then-write race and extra round-trips (requires SQLite 3.35+).
+        """
+        async with self.writer() as conn:
+            cursor = await conn.execute(
+                f"""INSERT INTO users (google_id, email, name, picture_url, created_at, last_login_at)
+                    VALUES (?, ?, ?, ?, {_SQLITE_NOW_MS}, {_SQLITE_NOW_MS})
+                    ON CONFLICT(google_id) DO UPDATE SET
+                        last_login_at = excluded.last_login_at, name = excluded.name, picture_url = excluded.picture_url
+                    RETURNING {USER_COLUMNS}""",
+                (google_id, email, name, picture_url)
+            )
+            row = await cursor.fetchone()
+            # Finish the statement so the autocommit write is released
+            await cursor.close()
+            return self._convert_row(row)
 
     async def create_session(self, user_id: int, expires_hours: int = 24) -> str:
-        """Create a new session with UUID and expiration."""
-        session_id = str(uuid.uuid4())
-        expires_at = datetime.utcnow() + timedelta(hours=expires_hours)
-        conn = await self._get_connection()
-        try:
+        """Create a new session with a random URL-safe ID and expiration."""
+        session_id = secrets.token_urlsafe(24)
+        expires_at = int(time.time()) + expires_hours * 3600
+        async with self.writer() as conn:
             await conn.execute(
                 "INSERT INTO sessions (id, user_id, expires_at) VALUES (?, ?, ?)",
-                (session_id, user_id, expires_at.isoformat())
+                (session_id, user_id, expires_at)
             )
-            await conn.commit()
-        finally:
-            await conn.close()
         return session_id
 
+    async def login_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None,
+                         expires_hours: int = 24) -> Tuple[dict, str]:
+        """Upsert the user and create a session with a single pool acquisition."""
+        session_id = secrets.token_urlsafe(24)
+        expires_at = int(time.time()) + expires_hours * 3600
+        async with self.writer() as conn:
+            cursor = await conn.execute(
+                f"""INSERT INTO users (google_id, email, name, picture_url, created_at, last_login_at)
+                    VALUES (?, ?, ?, ?, {_SQLITE_NOW_MS}, {_SQLITE_NOW_MS})
+                    ON CONFLICT(google_id) DO UPDATE SET
+                        last_login_at = excluded.last_login_at, name = excluded.name, picture_url = excluded.picture_url
+                    RETURNING {USER_COLUMNS}""",
+                (google_id, email, name, picture_url)
+            )
+            user = self._convert_row(await cursor.fetchone())
+            await cursor.close()
+            await conn.execute(
+                "INSERT INTO sessions (id, user_id, expires_at) VALUES (?, ?, ?)",
+                (session_id, user["id"], expires_at)
+            )
+        return user, session_id
+
     async def get_session(self, session_id: str) -> Optional[dict]:
         """Get session if valid (not revoked and not expired)."""
-        import aiosqlite
-        conn = await self._get_connection()
-        try:
-            conn.row_factory = aiosqlite.Row
+        async with self.acquire() as conn:
+            cursor = await conn.execute(_SQL_GET_SESSION_SQLITE, (session_id, int(time.time())))
+            row = await cursor.fetchone()
+            return dict(row) if row else None
+
+    async def get_session_with_user(self, session_id: str) -> Optional[dict]:
+        """Get valid session and its user with one JOIN query."""
+        async with self.acquire() as conn:
             cursor = await conn.execute(
-                """SELECT * FROM sessions WHERE id = ? AND is_revoked = FALSE AND expires_at > ?""",
-                (session_id, datetime.utcnow().isoformat())
+                _SQL_GET_SESSION_WITH_USER_SQLITE, (session_id, int(time.time()))
             )
             row = await cursor.fetchone()
-            return dict(row) if row else None
-        finally:
-            await conn.close()
+        return _split_session_user(self._convert_row(row)) if row else None
+
+    async def get_sessions_with_users(self, session_ids: List[str]) -> dict:
+        """Get valid sessions and their users with one JOIN query over an IN list."""
+        if not session_ids:
+            return {}
+        placeholders = ", ".join("?" * len(session_ids))
+        async with self.acquire() as conn:
+            cursor = await conn.execute(
+                f"""SELECT {SESSION_USER_COLUMNS}
+                    FROM sessions s JOIN users u ON u.id = s.user_id
+                    WHERE s.id IN ({placeholders}) AND s.is_revoked = FALSE AND s.expires_at > ?""",
+                (*session_ids, int(time.time()))
+            )
+            rows = await cursor.fetchall()
+        bundles = (_split_session_user(self._convert_row(row)) for row in rows)
+        return {bundle["session"]["id"]: bundle for bundle in bundles}
 
     async def revoke_session(self, session_id: str) -> None:
         """Mark session as revoked (logout)."""
-        conn = await self._get_connection()
-        try:
+        async with self.writer() as conn:
             await conn.execute("UPDATE sessions SET is_revoked = TRUE WHERE id = ?", (session_id,))
-            await conn.commit()
-        finally:
-            await conn.close()
 
     async def revoke_all_user_sessions(self, user_id: int) -> None:
         """Revoke all sessions for a user."""
-        conn = await self._get_connection()
-        try:
+        async with self.writer() as conn:
             await conn.execute("UPDATE sessions SET is_revoked = TRUE WHERE user_id = ?", (user_id,))
-            await conn.commit()
-        finally:
-            await conn.close()
 
     async def cleanup_expired_sessions(self) -> int:
-        """Delete expired sessions from database."""
-        conn = await self._get_connection()
-        try:
-            cursor = await conn.execute(
-                "DELETE FROM sessions WHERE expires_at < ?",
-                (datetime.utcnow().isoformat(),)
-            )
-            await conn.commit()
-            return cursor.rowcount
-        finally:
-            await conn.close()
+        """
+        Delete expired sessions from database.
+
+        Deletes in chunks of DELETE_BATCH_SIZE rows, each its own short
+        write, so live requests are not blocked behind one long table-wide
+        DELETE.
+        """
+        now = int(time.time())
+        total = 0
+        while True:
+            async with self.writer() as conn:
+                # sessions has a TEXT primary key, so matching on rowid skips
+                # the PK index probe and lets the subquery read only the
+                # expires_at index
+                cursor = await conn.execute(
+                    """DELETE FROM sessions WHERE rowid IN
+                       (SELECT rowid FROM sessions WHERE expires_at < ? LIMIT ?)""",
+                    (now, self.DELETE_BATCH_SIZE)
+                )
+                deleted = cursor.rowcount
+            total += deleted
+            if deleted < self.DELETE_BATCH_SIZE:
+                return total
 
     async def save_search_history(self, user_id: int, scenario: str, query_data: dict,
                                    results_data: list = None, result_count: int = 0,
                                    search_time_ms: float = 0) -> int:
         """Save search to history and return entry ID."""
-        conn = await self._get_connection()
-        try:
+        async with self.writer() as conn:
             cursor = await conn.execute(
-                """INSERT INTO search_history (user_id, scenario, query_data, results_data, result_count, search_time_ms)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (user_id, scenario, json.dumps(query_data),
-                 json.dumps(results_data) if results_data else None,
+                f"""INSERT INTO search_history
+                        (user_id, scenario, query_data, results_data, result_count, search_time_ms, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, {_SQLITE_NOW_MS})""",
+                (user_id, scenario, orjson.dumps(query_data).decode(),
+                 orjson.dumps(results_data).decode() if results_data else None,
                  result_count, search_time_ms)
             )
-            await conn.commit()
             return cursor.lastrowid
-        finally:
-            await conn.close()
 
-    async def get_search_history(self, user_id: int, limit: int = 50, offset: int = 0) -> List[dict]:
-        """Get user's search history, most recent first."""
-        import aiosqlite
-        conn = await self._get_connection()
-        try:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute(
-                """SELECT * FROM search_history WHERE user_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?""",
-                (user_id, limit, offset)
-            )
+    async def save_search_history_bulk(self, entries: List[tuple]) -> List[int]:
+        """
+        Save many searches with one executemany inside a single transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so the AUTOINCREMENT
+        IDs assigned to the batch are consecutive and end at last_insert_rowid().
+        """
+        if not entries:
+            return []
+        rows = [
+            (user_id, scenario, orjson.dumps(query_data).decode(),
+             orjson.dumps(results_data).decode() if results_data else None,
+             result_count, search_time_ms)
+            for user_id, scenario, query_data, results_data, result_count, search_time_ms in entries
+        ]
+        async with self.writer() as conn:
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                await conn.executemany(
+                    f"""INSERT INTO search_history
+                            (user_id, scenario, query_data, results_data, result_count, search_time_ms, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, {_SQLITE_NOW_MS})""",
+                    rows
+                )
+                cursor = await conn.execute("SELECT last_insert_rowid()")
+                (last_id,) = await cursor.fetchone()
+                await conn.execute("COMMIT")
+            except Exception:
+                await conn.execute("ROLLBACK")
+                raise
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    async def get_search_history(self, user_id: int, limit: int = 50, offset: int = 0,
+                                  include_results: bool = False) -> List[dict]:
+        """Get user's search history, most recent first (results_data only if include_results)."""
+        sql = _SQL_HISTORY_FULL_SQLITE if include_results else _SQL_HISTORY_LIST_SQLITE
+        async with self.acquire() as conn:
+            cursor = await conn.execute(sql, (user_id, limit, offset))
             rows = await cursor.fetchall()
-            results = []
-            for row in rows:
-                item = dict(row)
-                # Parse JSON fields
-                item["query_data"] = json.loads(item["query_data"])
-                item["results_data"] = json.loads(item["results_data"]) if item.get("results_data") else None
-                results.append(item)
-            return results
-        finally:
-            await conn.close()
+        results = []
+        for row in rows:
+            item = self._convert_row(row)
+            # Parse JSON fields
+            item["query_data"] = orjson.loads(item["query_data"])
+            if include_results:
+                item["results_data"] = orjson.loads(item["results_data"]) if item.get("results_data") else None
+            results.append(item)
+        return results
 
     async def get_history_entry(self, history_id: int, user_id: int) -> Optional[dict]:
         """Get a specific history entry by ID."""
-        import aiosqlite
-        conn = await self._get_connection()
-        try:
-            conn.row_factory = aiosqlite.Row
-            cursor = await conn.execute(
-                "SELECT * FROM search_history WHERE id = ? AND user_id = ?",
-                (history_id, user_id)
-            )
+        async with self.acquire() as conn:
+            cursor = await conn.execute(_SQL_GET_HISTORY_ENTRY_SQLITE, (history_id, user_id))
             row = await cursor.fetchone()
-            if row:
-                item = dict(row)
-                item["query_data"] = json.loads(item["query_data"])
-                item["results_data"] = json.loads(item["results_data"]) if item.get("results_data") else None
-                return item
-            return None
-        finally:
-            await conn.close()
+        if row:
+            item = self._convert_row(row)
+            item["query_data"] = orjson.loads(item["query_data"])
+            item["results_data"] = orjson.loads(item["results_data"]) if item.get("results_data") else None
+            return item
+        return None
 
     async def delete_history_entry(self, history_id: int, user_id: int) -> bool:
         """Delete a history entry. Returns True if deleted."""
-        conn = await self._get_connection()
-        try:
+        async with self.writer() as conn:
             cursor = await conn.execute(
                 "DELETE FROM search_history WHERE id = ? AND user_id = ?",
                 (history_id, user_id)
             )
-            await conn.commit()
             return cursor.rowcount > 0
-        finally:
-            await conn.close()
 
     async def clear_user_history(self, user_id: int) -> int:
-        """Delete all history for a user. Returns count deleted."""
-        conn = await self._get_connection()
-        try:
-            cursor = await conn.execute("DELETE FROM search_history WHERE user_id = ?", (user_id,))
-            await conn.commit()
-            return cursor.rowcount
-        finally:
-            await conn.close()
+        """Delete all history for a user in chunks. Returns count deleted."""
+        total = 0
+        while True:
+            async with self.writer() as conn:
+                cursor = await conn.execute(
+                    """DELETE FROM search_history WHERE id IN
+                       (SELECT id FROM search_history WHERE user_id = ? LIMIT ?)""",
+                    (user_id, self.DELETE_BATCH_SIZE)
+                )
+                deleted = cursor.rowcount
+            total += deleted
+            if deleted < self.DELETE_BATCH_SIZE:
+                return total
 
 
 # ============================================================================
 # PostgreSQL Implementation
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _prepared_connection_class():
+    """
+    Build the asyncpg connection class used by the PostgreSQL pool.
+
+    asyncpg.Connection uses __slots__, so a subclass is needed to attach
+    the per-connection prepared statement registry. Built on first use so
+    this module still imports when asyncpg is not installed.
+
+    Returns:
+        type: asyncpg.Connection subclass with a ``prepared`` slot
+    """
+    class _PreparedConnection(asyncpg.Connection):
+        """asyncpg connection holding its hot-path prepared statements."""
+        __slots__ = ("prepared",)
+
+    return _PreparedConnection
+
+
+# PostgreSQL's binary timestamp format counts microseconds from this instant
+_PG_TIMESTAMP_EPOCH: Final[datetime] = datetime(2000, 1, 1)
+_ONE_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+
+def _decode_pg_timestamp(value: tuple) -> str:
+    """
+    Decode a binary TIMESTAMP straight to an ISO-8601 string.
+
+    Args:
+        value: asyncpg tuple-format timestamp, (microseconds since 2000-01-01,)
+
+    Returns:
+        str: Same text as datetime.isoformat() on the decoded value
+    """
+    return (_PG_TIMESTAMP_EPOCH + timedelta(microseconds=value[0])).isoformat()
+
+
+def _encode_pg_timestamp(value) -> tuple:
+    """
+    Encode a datetime or ISO-8601 string as a tuple-format TIMESTAMP.
+
+    Args:
+        value: Naive datetime or ISO string
+
+    Returns:
+        tuple: (microseconds since 2000-01-01,)
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return ((value - _PG_TIMESTAMP_EPOCH) // _ONE_MICROSECOND,)
+
+
 class PostgreSQLDatabase(DatabaseInterface):
     """
     PostgreSQL database implementation using asyncpg.
 
     Uses connection pooling for better performance under load.
-    Pool size: 5-20 connections.
+    Pool size: 10-50 connections by default (PG_POOL_MIN / PG_POOL_MAX).
+    Each pooled connection decodes JSONB natively and carries prepared
+    statements for the per-request lookups.
 
     Best for: Production, multi-user scenarios, high concurrency.
     """
@@ -472,7 +977,7 @@ class PostgreSQLDatabase(DatabaseInterface):
     CREATE TABLE IF NOT EXISTS sessions (
         id TEXT PRIMARY KEY,
         user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-        expires_at TIMESTAMP NOT NULL,
+        expires_at BIGINT NOT NULL,  -- Unix epoch seconds
         is_revoked BOOLEAN DEFAULT FALSE
     );
 
@@ -489,179 +994,469 @@ class PostgreSQLDatabase(DatabaseInterface):
 
     CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
     CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at);
-    CREATE INDEX IF NOT EXISTS idx_search_history_user_id ON search_history(user_id);
-    CREATE INDEX IF NOT EXISTS idx_search_history_created_at ON search_history(created_at);
     """
 
+    # Migration for databases created before session expiries were stored
+    # as epoch seconds: converts a TIMESTAMP expires_at column in place
+    # (naive timestamps hold UTC, so EXTRACT(EPOCH) needs no zone shift)
+    SESSION_EXPIRY_MIGRATION = """
+    DO $$
+    BEGIN
+        IF EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_name = 'sessions' AND column_name = 'expires_at'
+                     AND data_type LIKE 'timestamp%') THEN
+            ALTER TABLE sessions ALTER COLUMN expires_at TYPE BIGINT
+                USING EXTRACT(EPOCH FROM expires_at)::BIGINT;
+        END IF;
+    END $$;
+    """
+
+    # Index migrations run one index at a time after SCHEMA (see
+    # _ensure_index): CONCURRENTLY cannot run inside the implicit transaction
+    # of a multi-statement script, and avoids blocking writes while building
+    # on an existing table. Each entry is (index name, CREATE statement,
+    # names of the older indexes it supersedes).
+    INDEX_MIGRATIONS = (
+        # History listing walks this index in order and stops at LIMIT
+        (
+            "idx_search_history_user_created",
+            """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_search_history_user_created
+               ON search_history(user_id, created_at DESC)""",
+            ("idx_search_history_user_id", "idx_search_history_created_at"),
+        ),
+        # Partial covering index over live sessions: session lookups are
+        # answered by an index-only scan and revoked rows are never indexed
+        (
+            "idx_sessions_active",
+            """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sessions_active
+               ON sessions(id) INCLUDE (expires_at, user_id, is_revoked) WHERE is_revoked = FALSE""",
+            ("idx_sessions_lookup",),
+        ),
+    )
+
+    # Hot-path statements prepared once per pooled connection (see _init_connection)
+    PREPARED_QUERIES = {
+        "get_user_by_google_id": _SQL_GET_USER_BY_GOOGLE_ID_PG,
+        "get_user_by_id": _SQL_GET_USER_BY_ID_PG,
+        "get_session": _SQL_GET_SESSION_PG,
+        "get_session_with_user": _SQL_GET_SESSION_WITH_USER_PG,
+        "get_sessions_with_users": _SQL_GET_SESSIONS_WITH_USERS_PG,
+        "get_history_list": _SQL_HISTORY_LIST_PG,
+        "get_history_full": _SQL_HISTORY_FULL_PG,
+        "get_history_entry": _SQL_GET_HISTORY_ENTRY_PG,
+        "create_session": _SQL_CREATE_SESSION_PG,
+        "update_user_login": _SQL_UPDATE_USER_LOGIN_PG,
+        "revoke_session": _SQL_REVOKE_SESSION_PG,
+        "save_history": _SQL_SAVE_HISTORY_PG,
+    }
+
     def __init__(self):
         """Initialize with no connection pool (created on init_db)."""
         self.pool = None
 
-    async def init_db(self) -> None:
-        """Create connection pool and initialize schema."""
-        import asyncpg
-        # Create connection pool with 5-20 connections
-        self.pool = await asyncpg.create_pool(
+    def acquire(self):
+        """
+        Borrow a pooled connection (use as ``async with self.acquire() as conn``).
+
+        Returns:
+            The pool's acquire context manager
+
+        Raises:
+            RuntimeError: If init_db() has not created the pool yet
+        """
+        if self.pool is None:
+            raise RuntimeError("PostgreSQLDatabase.init_db() has not been called")
+        return self.pool.acquire()
+
+    async def _init_connection(self, conn) -> None:
+        """
+        Prepare a new pooled connection.
+
+        Registers a binary JSONB codec backed by orjson, so JSONB columns
+        arrive as Python objects without a json.loads per row, and a
+        TIMESTAMP codec that decodes straight to ISO strings, so rows need
+        no per-column conversion. Also prepares the PREPARED_QUERIES
+        statements so hot-path reads and writes skip server-side
+        parse/plan.
+
+        Args:
+            conn: Newly opened connection (a _PreparedConnection)
+        """
+        # Binary JSONB wire format is a version byte (1) followed by JSON text
+        await conn.set_type_codec(
+            "jsonb",
+            encoder=lambda value: b"\x01" + orjson.dumps(value),
+            decoder=lambda data: orjson.loads(data[1:]),
+            schema="pg_catalog",
+            format="binary",
+        )
+        await conn.set_type_codec(
+            "timestamp",
+            encoder=_encode_pg_timestamp,
+            decoder=_decode_pg_timestamp,
+            schema="pg_catalog",
+            format="tuple",
+        )
+        conn.prepared = {name: await conn.prepare(sql) for name, sql in self.PREPARED_QUERIES.items()}
+
+    # Advisory lock key shared by every process migrating this database
+    _SQL_TRY_MIGRATION_LOCK = "SELECT pg_try_advisory_lock(hashtext('thinkstruct_migrations'))"
+    _SQL_MIGRATION_UNLOCK = "SELECT pg_advisory_unlock(hashtext('thinkstruct_migrations'))"
+    # Seconds between attempts to take the migration lock
+    MIGRATION_LOCK_POLL_INTERVAL = 0.5
+
+    # NULL when the index does not exist, false when a failed CONCURRENTLY
+    # build left it INVALID
+    _SQL_INDEX_VALID = "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1::text)"
+
+    async def _ensure_index(self, conn, name: str, create_sql: str, superseded: tuple) -> None:
+        """
+        Build an index concurrently, then drop the indexes it replaces.
+
+        A CREATE INDEX CONCURRENTLY that fails partway (deadlock, cancel,
+        killed process) leaves an INVALID index under the same name, which
+        IF NOT EXISTS would then skip on every later startup. Such a
+        leftover is dropped and rebuilt, and the superseded indexes are only
+        dropped once the replacement is confirmed valid.
+
+        Args:
+            conn: Migration connection (not inside a transaction)
+            name: Name of the index to build
+            create_sql: CREATE INDEX CONCURRENTLY statement for it
+            superseded: Names of the older indexes it replaces
+        """
+        valid = await conn.fetchval(self._SQL_INDEX_VALID, name)
+        if valid is False:
+            logger.warning(f"Rebuilding invalid index {name}")
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        if not valid:
+            await conn.execute(create_sql)
+            valid = await conn.fetchval(self._SQL_INDEX_VALID, name)
+        if not valid:
+            logger.error(f"Index {name} is not valid, keeping {', '.join(superseded)}")
+            return
+        for old_name in superseded:
+            await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {old_name}")
+
+    @staticmethod
+    def _connect_kwargs() -> dict:
+        """
+        Connection parameters shared by the migration connection and the pool.
+
+        Returns:
+            dict: host, port, database, user and password from settings
+        """
+        return dict(
             host=settings.pg_host,
             port=settings.pg_port,
             database=settings.pg_database,
             user=settings.pg_user,
             password=settings.pg_password,
-            min_size=5,
-            max_size=20
         )
-        # Create tables
-        async with self.pool.acquire() as conn:
-            await conn.execute(self.SCHEMA)
+
+    async def migrate(self) -> None:
+        """
+        Create tables and indexes if missing and apply schema migrations.
+
+        Processes migrating the same database take turns on a session-level
+        advisory lock. The lock is polled with pg_try_advisory_lock rather
+        than awaited in pg_advisory_lock: a backend blocked inside that call
+        holds a snapshot, and CREATE INDEX CONCURRENTLY in the lock holder
+        waits for older snapshots, so the two would deadlock.
+        """
+        conn = await asyncpg.connect(**self._connect_kwargs())
+        try:
+            while not await conn.fetchval(self._SQL_TRY_MIGRATION_LOCK):
+                await asyncio.sleep(self.MIGRATION_LOCK_POLL_INTERVAL)
+            try:
+                await conn.execute(self.SCHEMA)
+                await conn.execute(self.SESSION_EXPIRY_MIGRATION)
+                for name, create_sql, superseded in self.INDEX_MIGRATIONS:
+                    await self._ensure_index(conn, name, create_sql, superseded)
+            finally:
+                await conn.fetchval(self._SQL_MIGRATION_UNLOCK)
+        finally:
+            await conn.close()
+
+    async def init_db(self) -> None:
+        """Migrate the schema (unless disabled), then create the connection pool."""
+        # Migrate first - pooled connections prepare statements against the
+        # tables as soon as they are opened
+        if settings.run_migrations:
+            await self.migrate()
+        # Create connection pool (10-50 connections by default, see PG_POOL_* settings)
+        self.pool = await asyncpg.create_pool(
+            **self._connect_kwargs(),
+            min_size=settings.pg_pool_min,
+            max_size=settings.pg_pool_max,
+            max_inactive_connection_lifetime=settings.pg_pool_max_lifetime_s,
+            command_timeout=settings.pg_command_timeout,
+            connection_class=_prepared_connection_class(),
+            init=self._init_connection,
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0,
+        )
         logger.info("PostgreSQL database initialized")
+        if settings.run_session_cleanup:
+            self.start_session_cleanup()
 
     async def close(self) -> None:
-        """Close the connection pool."""
+        """Stop background cleanup and close the connection pool."""
+        await self.stop_session_cleanup()
         if self.pool:
             await self.pool.close()
+            self.pool = None
+
+    def pool_stats(self) -> dict:
+        """
+        Report asyncpg pool size, bounds and usage.
+
+        Returns:
+            dict: backend, size, idle, in_use, min_size, max_size
+        """
+        if self.pool is None:
+            size = idle = 0
+        else:
+            size, idle = self.pool.get_size(), self.pool.get_idle_size()
+        return {
+            "backend": "postgresql",
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": settings.pg_pool_min,
+            "max_size": settings.pg_pool_max,
+        }
 
     async def get_user_by_google_id(self, google_id: str) -> Optional[dict]:
         """Find user by Google account ID."""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM users WHERE google_id = $1", google_id)
+        async with self.acquire() as conn:
+            row = await conn.prepared["get_user_by_google_id"].fetchrow(google_id)
             return self._convert_row(row) if row else None
 
     async def get_user_by_id(self, user_id: int) -> Optional[dict]:
         """Find user by database ID."""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM users WHERE id = $1", user_id)
+        async with self.acquire() as conn:
+            row = await conn.prepared["get_user_by_id"].fetchrow(user_id)
             return self._convert_row(row) if row else None
 
     async def create_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None) -> dict:
         """Create new user and return with RETURNING clause."""
-        async with self.pool.acquire() as conn:
+        async with self.acquire() as conn:
             row = await conn.fetchrow(
-                """INSERT INTO users (google_id, email, name, picture_url)
-                   VALUES ($1, $2, $3, $4) RETURNING *""",
+                f"""INSERT INTO users (google_id, email, name, picture_url)
+                    VALUES ($1, $2, $3, $4) RETURNING {USER_COLUMNS}""",
                 google_id, email, name, picture_url
             )
             return self._convert_row(row)
 
     async def update_user_login(self, user_id: int) -> None:
         """Update last_login_at timestamp."""
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                "UPDATE users SET last_login_at = $1 WHERE id = $2",
-                datetime.utcnow(), user_id
-            )
+        async with self.acquire() as conn:
+            await conn.prepared["update_user_login"].fetchval(user_id)
 
     async def upsert_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None) -> dict:
-        """Create or update user on login."""
-        user = await self.get_user_by_google_id(google_id)
-        if user:
-            await self.update_user_login(user["id"])
-            return await self.get_user_by_id(user["id"])
-        return await self.create_user(google_id, email, name, picture_url)
+        """Create or update user on login in one atomic INSERT ... ON CONFLICT statement."""
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(
+                f"""INSERT INTO users (google_id, email, name, picture_url) VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (google_id) DO UPDATE SET
+                        last_login_at = NOW() AT TIME ZONE 'UTC', name = EXCLUDED.name, picture_url = EXCLUDED.picture_url
+                    RETURNING {USER_COLUMNS}""",
+                google_id, email, name, picture_url
+            )
+            return self._convert_row(row)
 
     async def create_session(self, user_id: int, expires_hours: int = 24) -> str:
-        """Create new session with UUID."""
-        session_id = str(uuid.uuid4())
-        expires_at = datetime.utcnow() + timedelta(hours=expires_hours)
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                "INSERT INTO sessions (id, user_id, expires_at) VALUES ($1, $2, $3)",
-                session_id, user_id, expires_at
-            )
+        """Create new session with a random URL-safe ID."""
+        session_id = secrets.token_urlsafe(24)
+        expires_at = int(time.time()) + expires_hours * 3600
+        async with self.acquire() as conn:
+            await conn.prepared["create_session"].fetchval(session_id, user_id, expires_at)
         return session_id
 
-    async def get_session(self, session_id: str) -> Optional[dict]:
-        """Get session if valid."""
-        async with self.pool.acquire() as conn:
+    async def login_user(self, google_id: str, email: str, name: str, picture_url: Optional[str] = None,
+                         expires_hours: int = 24) -> Tuple[dict, str]:
+        """
+        Upsert the user and create a session in one statement.
+
+        The session insert is a data-modifying CTE chained off the upsert's
+        RETURNING row, so login costs one pool acquisition and one
+        round-trip instead of two of each.
+        """
+        session_id = secrets.token_urlsafe(24)
+        expires_at = int(time.time()) + expires_hours * 3600
+        async with self.acquire() as conn:
             row = await conn.fetchrow(
-                """SELECT * FROM sessions WHERE id = $1 AND is_revoked = FALSE AND expires_at > $2""",
-                session_id, datetime.utcnow()
+                f"""WITH u AS (
+                        INSERT INTO users (google_id, email, name, picture_url) VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (google_id) DO UPDATE SET
+                            last_login_at = NOW() AT TIME ZONE 'UTC', name = EXCLUDED.name, picture_url = EXCLUDED.picture_url
+                        RETURNING {USER_COLUMNS}
+                    ), s AS (
+                        INSERT INTO sessions (id, user_id, expires_at) SELECT $5, id, $6 FROM u
+                    )
+                    SELECT * FROM u""",
+                google_id, email, name, picture_url, session_id, expires_at
             )
+            return self._convert_row(row), session_id
+
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        """Get session if valid."""
+        async with self.acquire() as conn:
+            row = await conn.prepared["get_session"].fetchrow(session_id, int(time.time()))
             return self._convert_row(row) if row else None
 
+    async def get_session_with_user(self, session_id: str) -> Optional[dict]:
+        """Get valid session and its user with one JOIN query."""
+        async with self.acquire() as conn:
+            row = await conn.prepared["get_session_with_user"].fetchrow(session_id, int(time.time()))
+            return _split_session_user(self._convert_row(row)) if row else None
+
+    async def get_sessions_with_users(self, session_ids: List[str]) -> dict:
+        """Get valid sessions and their users with one JOIN query over an array parameter."""
+        if not session_ids:
+            return {}
+        async with self.acquire() as conn:
+            rows = await conn.prepared["get_sessions_with_users"].fetch(list(session_ids), int(time.time()))
+        bundles = (_split_session_user(self._convert_row(row)) for row in rows)
+        return {bundle["session"]["id"]: bundle for bundle in bundles}
+
     async def revoke_session(self, session_id: str) -> None:
         """Mark session as revoked."""
-        async with self.pool.acquire() as conn:
-            await conn.execute("UPDATE sessions SET is_revoked = TRUE WHERE id = $1", session_id)
+        async with self.acquire() as conn:
+            await conn.prepared["revoke_session"].fetchval(session_id)
 
     async def revoke_all_user_sessions(self, user_id: int) -> None:
         """Revoke all sessions for a user."""
-        async with self.pool.acquire() as conn:
+        async with self.acquire() as conn:
             await conn.execute("UPDATE sessions SET is_revoked = TRUE WHERE user_id = $1", user_id)
 
     async def cleanup_expired_sessions(self) -> int:
-        """Delete expired sessions."""
-        async with self.pool.acquire() as conn:
-            result = await conn.execute("DELETE FROM sessions WHERE expires_at < $1", datetime.utcnow())
-            return int(result.split()[-1])
+        """Delete expired sessions in chunks, each its own short transaction."""
+        now = int(time.time())
+        total = 0
+        while True:
+            async with self.acquire() as conn:
+                # ctid = ANY(ARRAY(...)) deletes by physical row address
+                # (a TID scan) instead of probing the primary key per row
+                deleted = await conn.fetchval(
+                    """WITH d AS (DELETE FROM sessions WHERE ctid = ANY(ARRAY(
+                           SELECT ctid FROM sessions WHERE expires_at < $1 LIMIT $2)) RETURNING 1)
+                       SELECT count(*) FROM d""",
+                    now, self.DELETE_BATCH_SIZE
+                )
+            total += deleted
+            if deleted < self.DELETE_BATCH_SIZE:
+                return total
 
     async def save_search_history(self, user_id: int, scenario: str, query_data: dict,
                                    results_data: list = None, result_count: int = 0,
                                    search_time_ms: float = 0) -> int:
         """Save search to history with NOW() for accurate timestamps."""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """INSERT INTO search_history (user_id, scenario, query_data, results_data, result_count, search_time_ms, created_at)
-                   VALUES ($1, $2, $3, $4, $5, $6, NOW()) RETURNING id, created_at""",
-                user_id, scenario, json.dumps(query_data),
-                json.dumps(results_data) if results_data else None,
+        async with self.acquire() as conn:
+            row = await conn.prepared["save_history"].fetchrow(
+                user_id, scenario, query_data,
+                results_data if results_data else None,
                 result_count, search_time_ms
             )
             logger.info(f"Saved search history with id={row['id']}, created_at={row['created_at']}")
             return row["id"]
 
+    # Batches at least this large are written with binary COPY; smaller ones
+    # with a pipelined executemany, which skips COPY's per-call column-type
+    # introspection query
+    BULK_COPY_THRESHOLD = 1000
+
+    async def save_search_history_bulk(self, entries: List[tuple]) -> List[int]:
+        """
+        Save many searches with one pipelined executemany or binary COPY.
+
+        Neither returns generated keys, so the IDs are drawn from the
+        serial sequence first and written explicitly. created_at is left
+        out so the column default stamps each row. JSONB values go through
+        the binary codec registered in _init_connection.
+        """
+        if not entries:
+            return []
+        columns = ["id", "user_id", "scenario", "query_data", "results_data", "result_count", "search_time_ms"]
+        async with self.acquire() as conn:
+            ids = [
+                row[0] for row in await conn.fetch(
+                    "SELECT nextval(pg_get_serial_sequence('search_history', 'id')) FROM generate_series(1, $1)",
+                    len(entries)
+                )
+            ]
+            records = [
+                (history_id, user_id, scenario, query_data, results_data if results_data else None,
+                 result_count, search_time_ms)
+                for history_id, (user_id, scenario, query_data, results_data, result_count, search_time_ms)
+                in zip(ids, entries)
+            ]
+            if len(records) >= self.BULK_COPY_THRESHOLD:
+                await conn.copy_records_to_table("search_history", records=records, columns=columns)
+            else:
+                await conn.executemany(
+                    f"""INSERT INTO search_history ({", ".join(columns)})
+                        VALUES ($1, $2, $3, $4, $5, $6, $7)""",
+                    records
+                )
+        logger.info(f"Saved {len(ids)} search history entries")
+        return ids
+
     def _convert_row(self, row) -> dict:
         """
-        Convert asyncpg row to dict with proper type handling.
-
-        Converts datetime objects to ISO strings and handles JSONB fields.
-        """
-        item = dict(row)
-        # Convert datetime to ISO string for JSON serialization
-        for key in ["created_at", "last_login_at", "expires_at"]:
-            if key in item and item[key] is not None:
-                if hasattr(item[key], 'isoformat'):
-                    item[key] = item[key].isoformat()
-        # Handle JSONB fields (asyncpg may return them as strings or dicts)
-        if "query_data" in item:
-            if isinstance(item["query_data"], str):
-                item["query_data"] = json.loads(item["query_data"])
-        if "results_data" in item:
-            if isinstance(item["results_data"], str):
-                item["results_data"] = json.loads(item["results_data"])
-        return item
-
-    async def get_search_history(self, user_id: int, limit: int = 50, offset: int = 0) -> List[dict]:
-        """Get user's search history, most recent first."""
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT * FROM search_history WHERE user_id = $1 ORDER BY created_at DESC LIMIT $2 OFFSET $3""",
-                user_id, limit, offset
-            )
+        Convert asyncpg row to dict.
+
+        No per-column handling is needed: the codecs registered in
+        _init_connection already decode TIMESTAMP columns to ISO strings
+        (matching the SQLite backend and the str-typed timestamp fields on
+        the response models) and JSONB columns to Python objects.
+        """
+        return dict(row)
+
+    async def get_search_history(self, user_id: int, limit: int = 50, offset: int = 0,
+                                  include_results: bool = False) -> List[dict]:
+        """
+        Get user's search history, most recent first.
+
+        The JSONB codec decodes every selected JSONB column eagerly, so the
+        lean query leaves results_data out of the column list entirely
+        unless include_results is set.
+        """
+        async with self.acquire() as conn:
+            stmt = conn.prepared["get_history_full" if include_results else "get_history_list"]
+            rows = await stmt.fetch(user_id, limit, offset)
             return [self._convert_row(row) for row in rows]
 
     async def get_history_entry(self, history_id: int, user_id: int) -> Optional[dict]:
         """Get a specific history entry."""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT * FROM search_history WHERE id = $1 AND user_id = $2",
-                history_id, user_id
-            )
+        async with self.acquire() as conn:
+            row = await conn.prepared["get_history_entry"].fetchrow(history_id, user_id)
             return self._convert_row(row) if row else None
 
     async def delete_history_entry(self, history_id: int, user_id: int) -> bool:
-        """Delete a history entry."""
-        async with self.pool.acquire() as conn:
-            result = await conn.execute(
-                "DELETE FROM search_history WHERE id = $1 AND user_id = $2",
+        """Delete a history entry (RETURNING yields a row only if one was deleted)."""
+        async with self.acquire() as conn:
+            deleted = await conn.fetchval(
+                "DELETE FROM search_history WHERE id = $1 AND user_id = $2 RETURNING 1",
                 history_id, user_id
             )
-            return int(result.split()[-1]) > 0
+            return deleted is not None
 
     async def clear_user_history(self, user_id: int) -> int:
-        """Delete all history for a user."""
-        async with self.pool.acquire() as conn:
-            result = await conn.execute("DELETE FROM search_history WHERE user_id = $1", user_id)
-            return int(result.split()[-1])
+        """Delete all history for a user in chunks."""
+        total = 0
+        while True:
+            async with self.acquire() as conn:
+                deleted = await conn.fetchval(
+                    """WITH d AS (DELETE FROM search_history WHERE ctid = ANY(ARRAY(
+                           SELECT ctid FROM search_history WHERE user_id = $1 LIMIT $2)) RETURNING 1)
+                       SELECT count(*) FROM d""",
+                    user_id, self.DELETE_BATCH_SIZE
+                )
+            total += deleted
+            if deleted < self.DELETE_BATCH_SIZE:
+                return total
 
 
 # ============================================================================
@@ -677,14 +1472,35 @@ def create_database() -> DatabaseInterface:
 
     Returns:
         DatabaseInterface: SQLiteDatabase or PostgreSQLDatabase
+
+    Raises:
+        ImportError: If the driver for the configured database is not installed
     """
     if settings.database_type == "postgresql":
+        if asyncpg is None:
+            raise ImportError("DATABASE_TYPE=postgresql requires the asyncpg package")
         logger.info("Using PostgreSQL database")
         return PostgreSQLDatabase()
     else:
+        if aiosqlite is None:
+            raise ImportError("DATABASE_TYPE=sqlite requires the aiosqlite package")
         logger.info("Using SQLite database")
         return SQLiteDatabase()
 
 
+@functools.lru_cache(maxsize=1)
+def get_db() -> DatabaseInterface:
+    """
+    Return the process-wide database instance, creating it on first call.
+
+    Memoized, so every caller (including FastAPI's Depends(get_db)) shares
+    one instance and one connection pool.
+
+    Returns:
+        DatabaseInterface: The shared database instance
+    """
+    return create_database()
+
+
 # Global database instance - init_db() called during app startup
-db = create_database()
+db = get_db()
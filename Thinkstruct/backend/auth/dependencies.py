@@ -6,6 +6,8 @@ Dependencies are used in route handlers to get the current user.
 
 Dependencies:
 - get_token_from_request: Extract JWT from header or cookie
+- load_user: Get a user profile via the in-process cache, Redis, then the DB
+- load_session_user: Resolve a session's user via the session store, Redis, then the DB
 - get_current_user: Get authenticated user (raises 401 if not logged in)
 - get_optional_user: Get user if authenticated (returns None otherwise)
 
@@ -21,12 +23,33 @@ Usage in routes:
         return {"logged_in": False}
 """
 
+import asyncio
+import time
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status, Cookie, Header
 
+from .cache import cache
 from .database import db
 from .jwt_handler import JWTHandler
+from .loaders import session_user_loader
 from .models import User
+from .session_store import session_store
+
+# Upper bound on how long a session read from the database stays cached
+SESSION_CACHE_TTL = 3600
+
+# In-process user profile cache, used with or without Redis. Profiles only
+# change on login, so a short TTL bounds staleness of name/picture_url.
+USER_CACHE_TTL = 15
+_user_cache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+# Locks sharded by user ID so concurrent misses for one user share a
+# single fetch instead of stampeding the database
+_user_locks = [asyncio.Lock() for _ in range(64)]
+
+# Authorization header scheme prefix and its length
+_BEARER_PREFIX = "Bearer "
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
 
 
 async def get_token_from_request(
@@ -42,6 +65,10 @@ async def get_token_from_request(
 
     Authorization header takes priority over cookie.
 
+    Deliberately an async def although it awaits nothing: FastAPI runs
+    plain def dependencies in its threadpool, which would add a thread
+    hand-off to every authenticated request.
+
     Args:
         authorization: Authorization header value (injected by FastAPI)
         access_token: Cookie value (injected by FastAPI)
@@ -51,13 +78,83 @@ async def get_token_from_request(
         None: If no token in request
     """
     # Check Authorization header first (standard OAuth approach)
-    if authorization and authorization.startswith("Bearer "):
-        return authorization[7:]  # Remove "Bearer " prefix
+    if authorization and authorization.startswith(_BEARER_PREFIX):
+        return authorization[_BEARER_PREFIX_LEN:]  # Remove "Bearer " prefix
 
     # Fall back to cookie (for browser-based requests)
     return access_token
 
 
+async def load_user(user_id: int) -> Optional[dict]:
+    """
+    Get a user profile, reading through the in-process and Redis caches.
+
+    Args:
+        user_id: User's database ID
+
+    Returns:
+        dict: User data if the user exists
+        None: If no such user
+    """
+    user_data = _user_cache.get(user_id)
+    if user_data is not None:
+        return user_data
+
+    async with _user_locks[user_id % len(_user_locks)]:
+        # Another request may have filled the cache while we waited
+        user_data = _user_cache.get(user_id)
+        if user_data is None:
+            user_data = await cache.get_cached_user(user_id) or await db.get_user_by_id(user_id)
+            if user_data:
+                _user_cache[user_id] = user_data
+    return user_data
+
+
+async def load_session_user(session_id: str, user_id: int) -> Optional[dict]:
+    """
+    Get the user owning a valid session, reading through the Redis cache.
+
+    Sessions recently validated by this process are answered by the
+    in-process session store, leaving only the user profile to fetch.
+    Otherwise the Redis session cache is tried, and on a miss the session
+    and its user are loaded with one database query (batched with other
+    requests' lookups by session_user_loader) and cached for the
+    session's remaining lifetime (capped at SESSION_CACHE_TTL). Logout and
+    logout-all invalidate the cached entries.
+
+    Args:
+        session_id: Session ID from the JWT payload
+        user_id: User ID (token subject) the session must belong to
+
+    Returns:
+        dict: User data if the session is valid and owned by user_id
+        None: If the session is expired, revoked, or belongs to another user
+    """
+    if session_store.is_valid(session_id, user_id):
+        user_data = await load_user(user_id)
+        if user_data:
+            return user_data
+
+    cached = await cache.get_cached_session(session_id, user_id)
+    if cached is not None and cached.get("id") == user_id:
+        session_store.add(session_id, user_id)
+        return cached
+
+    bundle = await session_user_loader.load(session_id)
+    if not bundle or bundle["user"]["id"] != user_id:
+        return None
+
+    user_data = bundle["user"]
+    _user_cache[user_id] = user_data
+    expires_at = bundle["session"]["expires_at"]
+    remaining = expires_at - time.time()
+    ttl = int(min(SESSION_CACHE_TTL, remaining))
+    if ttl > 0:
+        await cache.cache_session(session_id, {**user_data, "user_id": user_id}, ttl=ttl)
+        session_store.add(session_id, user_id, expires_at)
+    return user_data
+
+
 async def get_current_user(
     token: Optional[str] = Depends(get_token_from_request)
 ) -> User:
@@ -97,20 +194,20 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Check if session is still valid (not revoked)
+    # Check session validity (not revoked) and load its user
+    user_id = int(payload["sub"])
     session_id = payload.get("session_id")
     if session_id:
-        session = await db.get_session(session_id)
-        if not session:
+        user_data = await load_session_user(session_id, user_id)
+        if not user_data:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Session expired or revoked",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-
-    # Get user from database
-    user_id = int(payload["sub"])
-    user_data = await db.get_user_by_id(user_id)
+    else:
+        # Get user from database
+        user_data = await load_user(user_id)
     if not user_data:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -118,7 +215,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return User(**user_data)
+    # Rows come from our own DB or cache, so skip re-validating them
+    return User.model_construct(**user_data)
 
 
 async def get_optional_user(
@@ -150,17 +248,18 @@ async def get_optional_user(
     if not payload:
         return None
 
-    # Check session validity - return None if revoked
+    # Check session validity and load its user - return None if revoked
+    user_id = int(payload["sub"])
     session_id = payload.get("session_id")
     if session_id:
-        session = await db.get_session(session_id)
-        if not session:
+        user_data = await load_session_user(session_id, user_id)
+        if not user_data:
             return None
-
-    # Get user - return None if not found
-    user_id = int(payload["sub"])
-    user_data = await db.get_user_by_id(user_id)
+    else:
+        # Get user - return None if not found
+        user_data = await load_user(user_id)
     if not user_data:
         return None
 
-    return User(**user_data)
+    # Rows come from our own DB or cache, so skip re-validating them
+    return User.model_construct(**user_data)
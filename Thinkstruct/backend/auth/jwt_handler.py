@@ -17,17 +17,87 @@ Usage:
     from .jwt_handler import JWTHandler
 
     # Create token after login
-    token = JWTHandler.create_token(user_id=1, session_id="uuid-string")
+    token = JWTHandler.create_token(user_id=1, session_id="session-id")
 
     # Verify token from request
     payload = JWTHandler.verify_token(token)
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+import functools
+import time
+from typing import Optional, Tuple
+import orjson
+from cachetools import TTLCache
+from jwt import InvalidTokenError, PyJWS
+from jwt.utils import base64url_decode
 
-from .config import settings
+from . import config
+
+# JWS layer of PyJWT: signs and verifies raw payload bytes. Payload JSON is
+# handled with orjson here instead of PyJWT's stdlib json round-trip.
+_jws = PyJWS()
+
+
+@functools.lru_cache(maxsize=1)
+def _signing_params() -> Tuple[bytes, str, tuple]:
+    """
+    Resolve the signing key and algorithm from settings on first use.
+
+    Resolved once rather than at import, so importing this module does not
+    parse the environment.
+
+    Returns:
+        tuple: (secret pre-encoded to the bytes HMAC needs, algorithm,
+            reusable algorithms sequence for verification)
+    """
+    algorithm = config.settings.jwt_algorithm
+    return config.settings.jwt_secret.encode(), algorithm, (algorithm,)
+
+
+@functools.lru_cache(maxsize=1)
+def _verified_tokens() -> TTLCache:
+    """
+    Get the cache of verified token payloads, created on first use.
+
+    Payloads of tokens that passed verification, keyed by the raw token.
+    Clients resend the same token on every request, so repeat
+    verifications skip the signature check. Only valid tokens are
+    inserted, and each hit re-checks the token's own exp claim, so an
+    expired token is never served.
+
+    Returns:
+        TTLCache: Shared token -> payload cache, TTL = token lifetime
+    """
+    return TTLCache(maxsize=10_000, ttl=config.settings.jwt_expiration_hours * 3600)
+
+
+def _peek_payload(token: str) -> Optional[dict]:
+    """
+    Decode a token's payload segment without verifying its signature.
+
+    Lets verify_token reject malformed and expired tokens before paying
+    for the signature check. The result must not be trusted until the
+    signature over the same segment has been verified.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        dict: Unverified payload if it carries an integer exp in the future
+        None: If the token is malformed, lacks exp, or has expired
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = orjson.loads(base64url_decode(parts[1]))
+    except (ValueError, TypeError):
+        # binascii.Error and orjson.JSONDecodeError are ValueErrors
+        return None
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+    if not isinstance(exp, int) or exp <= time.time():
+        return None
+    return payload
 
 
 class JWTHandler:
@@ -59,23 +129,26 @@ class JWTHandler:
             str: Encoded JWT token string
         """
         if expires_hours is None:
-            expires_hours = settings.jwt_expiration_hours
+            expires_hours = config.settings.jwt_expiration_hours
 
-        expires_at = datetime.utcnow() + timedelta(hours=expires_hours)
+        # Claims are integer epoch seconds (RFC 7519 NumericDate), so no
+        # datetime objects are built and converted back during encoding
+        issued_at = int(time.time())
 
         # Build token payload
         payload = {
-            "sub": str(user_id),      # Subject: user identifier
-            "session_id": session_id,  # For session revocation
-            "exp": expires_at,         # Expiration time
-            "iat": datetime.utcnow(),  # Issued at time
+            "sub": str(user_id),                           # Subject: user identifier
+            "session_id": session_id,                      # For session revocation
+            "exp": issued_at + expires_hours * 3600,       # Expiration time
+            "iat": issued_at,                              # Issued at time
         }
 
-        # Sign and encode the token
-        return jwt.encode(
-            payload,
-            settings.jwt_secret,
-            algorithm=settings.jwt_algorithm
+        # Sign and encode the token (compact JSON, same bytes jwt.encode produces)
+        secret, algorithm, _ = _signing_params()
+        return _jws.encode(
+            orjson.dumps(payload),
+            secret,
+            algorithm=algorithm
         )
 
     @staticmethod
@@ -84,7 +157,13 @@ class JWTHandler:
         Verify a JWT token and return payload if valid.
 
         Decodes and validates the token signature and expiration.
-        Returns None if token is invalid or expired.
+        Returns None if token is invalid or expired. The payload is
+        parsed with orjson and must carry an integer exp claim in the
+        future; only then is the signature checked by PyJWT.
+
+        Tokens verified before are answered from _verified_tokens() after
+        an expiry check. The cached payload is shared between calls and
+        must not be mutated.
 
         Args:
             token: JWT token string to verify
@@ -93,16 +172,53 @@ class JWTHandler:
             dict: Token payload if valid
             None: If token is invalid, expired, or malformed
         """
+        verified_tokens = _verified_tokens()
+        payload = verified_tokens.get(token)
+        if payload is not None:
+            if payload["exp"] > time.time():
+                return payload
+            verified_tokens.pop(token, None)
+            return None
+
+        # Reject malformed, exp-less and expired tokens without running HMAC
+        payload = _peek_payload(token)
+        if payload is None:
+            return None
+
+        secret, _, algorithms = _signing_params()
         try:
-            payload = jwt.decode(
+            # Verifies the signature over the same payload segment peeked above
+            _jws.decode(
                 token,
-                settings.jwt_secret,
-                algorithms=[settings.jwt_algorithm]
+                secret,
+                algorithms=algorithms
             )
-            return payload
-        except JWTError:
-            # Token is invalid, expired, or has wrong signature
+        except InvalidTokenError:
+            # Token is malformed or has wrong signature - never cached
             return None
+        verified_tokens[token] = payload
+        return payload
+
+    @staticmethod
+    def get_claims(token: str) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Extract user ID and session ID from a valid token with one verification.
+
+        Prefer this (or verify_token) over calling get_user_id_from_token
+        and get_session_id_from_token back to back, which verifies twice.
+
+        Args:
+            token: JWT token string
+
+        Returns:
+            tuple: (user_id, session_id); either is None if the token is
+                invalid or lacks that claim
+        """
+        payload = JWTHandler.verify_token(token)
+        if not payload:
+            return None, None
+        user_id = int(payload["sub"]) if "sub" in payload else None
+        return user_id, payload.get("session_id")
 
     @staticmethod
     def get_user_id_from_token(token: str) -> Optional[int]:
@@ -110,7 +226,8 @@ class JWTHandler:
         Extract user ID from a valid token.
 
         Convenience method for getting user ID from token
-        without handling the full payload.
+        without handling the full payload. Use get_claims when the
+        session ID is needed too.
 
         Args:
             token: JWT token string
@@ -119,17 +236,15 @@ class JWTHandler:
             int: User ID if token is valid
             None: If token is invalid or doesn't contain user ID
         """
-        payload = JWTHandler.verify_token(token)
-        if payload and "sub" in payload:
-            return int(payload["sub"])
-        return None
+        return JWTHandler.get_claims(token)[0]
 
     @staticmethod
     def get_session_id_from_token(token: str) -> Optional[str]:
         """
         Extract session ID from a valid token.
 
-        Used for checking if session has been revoked.
+        Used for checking if session has been revoked. Use get_claims
+        when the user ID is needed too.
 
         Args:
             token: JWT token string
@@ -138,7 +253,4 @@ class JWTHandler:
             str: Session ID if token is valid
             None: If token is invalid or doesn't contain session ID
         """
-        payload = JWTHandler.verify_token(token)
-        if payload and "session_id" in payload:
-            return payload["session_id"]
-        return None
+        return JWTHandler.get_claims(token)[1]
@@ -0,0 +1,118 @@
+"""
+Batched Session Loader
+
+This module coalesces cold session lookups into batched database queries.
+
+When a page fires several authenticated requests at once (or traffic
+arrives right after a restart, before the session caches are warm), every
+request would otherwise run its own session+user query. The loader
+collects the session IDs requested during one event-loop iteration and
+resolves them all with a single get_sessions_with_users() query. Repeated
+IDs within a batch - parallel requests carrying the same token - share
+one result.
+
+Only cache misses reach the loader: the in-process session store and the
+Redis cache still answer warm requests.
+
+Usage:
+    from .loaders import session_user_loader
+
+    # Resolves to {"session": ..., "user": ...}, or None if invalid
+    bundle = await session_user_loader.load(session_id)
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from .database import db
+
+logger = logging.getLogger(__name__)
+
+
+class SessionUserLoader:
+    """
+    DataLoader-style batcher for get_sessions_with_users().
+
+    load() registers a future per distinct session ID and schedules one
+    dispatch for the end of the current event-loop iteration; the dispatch
+    runs a single query and resolves every waiting future.
+
+    Attributes:
+        max_batch_size: Pending IDs that trigger an immediate dispatch
+    """
+
+    __slots__ = ("max_batch_size", "_pending", "_scheduled", "_tasks")
+
+    def __init__(self, max_batch_size: int = 500):
+        """
+        Create an idle loader.
+
+        Args:
+            max_batch_size: Largest number of session IDs sent in one query
+        """
+        self.max_batch_size = max_batch_size
+        self._pending: dict[str, asyncio.Future] = {}
+        self._scheduled = False
+        # Strong references to in-flight batch tasks until they finish
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, session_id: str) -> Optional[dict]:
+        """
+        Get a valid session and its user, batched with concurrent lookups.
+
+        Args:
+            session_id: Session ID to resolve
+
+        Returns:
+            dict: {"session": ..., "user": ...} if the session is valid
+            None: If the session is unknown, expired, or revoked
+
+        Raises:
+            Exception: Whatever the batch query raised
+        """
+        future = self._pending.get(session_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[session_id] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        # shield: a cancelled request must not cancel the shared future
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Hand the pending batch to a task that runs the query."""
+        self._scheduled = False
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future]) -> None:
+        """
+        Run one batched query and resolve the batch's futures.
+
+        Args:
+            batch: Session IDs mapped to the futures waiting on them
+        """
+        try:
+            bundles = await db.get_sessions_with_users(list(batch))
+        except Exception as e:
+            logger.error(f"Batched session lookup failed: {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for session_id, future in batch.items():
+            if not future.done():
+                future.set_result(bundles.get(session_id))
+
+
+# Global loader instance
+session_user_loader = SessionUserLoader()
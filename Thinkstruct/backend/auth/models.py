@@ -17,7 +17,8 @@ Usage:
 
 from datetime import datetime
 from typing import Optional, Any, Dict
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, TypeAdapter
+from pydantic.dataclasses import dataclass
 
 
 # ============================================================================
@@ -84,15 +85,15 @@ class Session(BaseModel):
     Sessions can be revoked for logout functionality.
 
     Attributes:
-        id: Unique session ID (UUID)
+        id: Unique session ID (32-char URL-safe random token)
         user_id: Associated user's ID
-        expires_at: Session expiration timestamp
+        expires_at: Session expiration time (Unix epoch seconds)
         is_revoked: Whether session has been logged out
     """
 
     id: str
     user_id: int
-    expires_at: str
+    expires_at: int
     is_revoked: bool = False
 
 
@@ -194,6 +195,17 @@ class SearchHistoryResponse(BaseModel):
     created_at: str
 
 
+class SearchHistoryBatchResponse(BaseModel):
+    """
+    Response for saving several searches at once.
+
+    Attributes:
+        ids: IDs of the new history entries, in request order
+    """
+
+    ids: list[int]
+
+
 class SearchHistoryListResponse(BaseModel):
     """
     Paginated list of search history entries.
@@ -207,6 +219,11 @@ class SearchHistoryListResponse(BaseModel):
     total: int
 
 
+# Validates a whole page of history rows in one pydantic-core call instead
+# of building SearchHistoryResponse objects one by one in Python
+HISTORY_LIST_ADAPTER = TypeAdapter(list[SearchHistoryResponse])
+
+
 # ============================================================================
 # Status Models
 # ============================================================================
@@ -228,7 +245,10 @@ class AuthStatus(BaseModel):
     oauth_configured: bool
 
 
-class MessageResponse(BaseModel):
+# A slotted pydantic dataclass rather than a BaseModel: it is response-only,
+# and instances carry no __dict__ or model bookkeeping
+@dataclass(slots=True)
+class MessageResponse:
     """
     Generic message response for simple operations.
 
@@ -0,0 +1,165 @@
+"""
+In-Process Session Store
+
+This module provides a small in-memory store that answers the hottest auth
+question - "is this session still valid for this user?" - without a Redis
+or database round-trip.
+
+Session records are kept as a struct of arrays: one numpy array of owner
+user IDs and one of expiry times (epoch seconds), indexed through a dict
+that maps session ID to slot. A lookup is one dict probe plus two array
+reads, and no per-session Python dict is allocated.
+
+Entries live at most _MAX_AGE seconds (matching the Redis cache's L1 TTL)
+because revocations made by other worker processes cannot reach this
+process's memory. Logout in this process discards entries immediately.
+
+Usage:
+    from .session_store import session_store
+
+    # Record a session after it was validated against Redis or the DB
+    session_store.add(session_id, user_id, expires_at)
+
+    # Check validity without any I/O
+    if session_store.is_valid(session_id, user_id):
+        ...
+
+    # Forget sessions on logout / logout-all
+    session_store.discard(session_id)
+    session_store.discard_user(user_id)
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+from .config import settings
+
+# Longest time an entry is trusted before it must be re-validated
+_MAX_AGE = 30
+
+
+class SessionCache:
+    """
+    Fixed-capacity session validity store laid out as a struct of arrays.
+
+    Slots are reused in ring-buffer order once the store is full, so the
+    oldest inserted session is evicted first. A capacity of 0 disables the
+    store: add() is a no-op and is_valid() always returns False.
+
+    Attributes:
+        capacity: Maximum number of sessions held
+    """
+
+    __slots__ = ("capacity", "_index", "_keys", "_user_ids", "_expires_at", "_next")
+
+    def __init__(self, capacity: int):
+        """
+        Allocate the backing arrays.
+
+        Args:
+            capacity: Maximum number of sessions held (0 disables the store)
+        """
+        self.capacity = max(0, capacity)
+        self._index: dict[str, int] = {}
+        self._keys: list[Optional[str]] = [None] * self.capacity
+        self._user_ids = np.zeros(self.capacity, dtype=np.int64)
+        self._expires_at = np.zeros(self.capacity, dtype=np.int64)
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def is_valid(self, session_id: str, user_id: int) -> bool:
+        """
+        Check whether a session is known, unexpired, and owned by user_id.
+
+        Args:
+            session_id: Session ID from the JWT payload
+            user_id: User ID the session must belong to
+
+        Returns:
+            bool: True if the session can be trusted without further lookups
+        """
+        slot = self._index.get(session_id)
+        if slot is None:
+            return False
+        return bool(self._user_ids[slot] == user_id and self._expires_at[slot] > time.time())
+
+    def add(self, session_id: str, user_id: int, expires_at: Optional[float] = None) -> None:
+        """
+        Record a session that was just validated elsewhere.
+
+        The stored expiry is clamped to _MAX_AGE seconds from now.
+
+        Args:
+            session_id: Validated session ID
+            user_id: Owner of the session
+            expires_at: Session expiry as epoch seconds (None = _MAX_AGE from now)
+        """
+        if not self.capacity:
+            return
+        deadline = time.time() + _MAX_AGE
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+
+        slot = self._index.get(session_id)
+        if slot is None:
+            slot = self._next
+            self._next = (slot + 1) % self.capacity
+            evicted = self._keys[slot]
+            if evicted is not None:
+                del self._index[evicted]
+            self._keys[slot] = session_id
+            self._index[session_id] = slot
+
+        self._user_ids[slot] = user_id
+        self._expires_at[slot] = int(deadline)
+
+    def discard(self, session_id: str) -> None:
+        """
+        Forget a single session (e.g., on logout).
+
+        Args:
+            session_id: Session ID to remove
+        """
+        slot = self._index.pop(session_id, None)
+        if slot is not None:
+            self._keys[slot] = None
+            self._expires_at[slot] = 0
+
+    def discard_user(self, user_id: int) -> int:
+        """
+        Forget every session owned by a user (e.g., on logout-all).
+
+        The owning slots are found with one vectorized comparison over the
+        user ID array rather than a scan of the index dict.
+
+        Args:
+            user_id: User whose sessions should be removed
+
+        Returns:
+            int: Number of sessions removed
+        """
+        slots = np.flatnonzero(self._user_ids == user_id)
+        removed = 0
+        for slot in slots.tolist():
+            session_id = self._keys[slot]
+            if session_id is not None:
+                del self._index[session_id]
+                self._keys[slot] = None
+                removed += 1
+        self._expires_at[slots] = 0
+        return removed
+
+    def clear(self) -> None:
+        """Forget all sessions."""
+        self._index.clear()
+        self._keys = [None] * self.capacity
+        self._expires_at.fill(0)
+        self._next = 0
+
+
+# Global session store instance
+session_store = SessionCache(settings.session_store_size)
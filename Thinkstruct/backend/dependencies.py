@@ -13,22 +13,29 @@ Usage in routes:
         return engine.search(...)
 """
 
+import threading
 from pathlib import Path
 from typing import Optional
 
 from .services import PatentSearchEngine, get_latest_data_file
 
 # Global search engine instance (singleton pattern)
-# Initialized lazily on first request to avoid startup delay
+# Warmed during application startup (see main.lifespan), otherwise
+# initialized on first request
 _engine: Optional[PatentSearchEngine] = None
+# get_engine is a sync dependency, so FastAPI calls it from threadpool
+# threads; the lock keeps a burst of first requests from each loading the
+# model and embeddings
+_engine_lock = threading.Lock()
 
 
 def get_engine() -> PatentSearchEngine:
     """
     Get the PatentSearchEngine singleton instance.
 
-    Uses lazy loading - the engine is only created on first call.
-    This avoids loading the model during application startup.
+    Uses lazy loading - the engine is only created on first call, which
+    the application lifespan makes at startup. Creation is guarded by
+    double-checked locking, so concurrent first calls build it once.
 
     The engine loads:
     - Patent data from the latest cleaned JSON file
@@ -44,14 +51,16 @@ def get_engine() -> PatentSearchEngine:
     global _engine
 
     if _engine is None:
-        # Find the data directory relative to this file
-        # Path: backend/dependencies.py -> backend -> Thinkstruct -> data/cleaned_output
-        data_dir = Path(__file__).parent.parent / "data" / "cleaned_output"
+        with _engine_lock:
+            if _engine is None:
+                # Find the data directory relative to this file
+                # Path: backend/dependencies.py -> backend -> Thinkstruct -> data/cleaned_output
+                data_dir = Path(__file__).parent.parent / "data" / "cleaned_output"
 
-        # Get the latest cleaned patent data file
-        data_file = get_latest_data_file(data_dir)
+                # Get the latest cleaned patent data file
+                data_file = get_latest_data_file(data_dir)
 
-        # Create the search engine (loads data and embeddings)
-        _engine = PatentSearchEngine(data_file)
+                # Create the search engine (loads data and embeddings)
+                _engine = PatentSearchEngine(data_file)
 
     return _engine
@@ -15,10 +15,14 @@ Features:
 - Optional Redis caching
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 # Import routers for different API endpoints
 from .routers import (
@@ -35,6 +39,8 @@ from .routers.history import router as history_router
 from .auth.database import db
 from .auth.cache import cache
 from .auth.config import settings
+from .auth.oauth import GoogleOAuth
+from .dependencies import get_engine
 
 # ============================================================================
 # Logging Configuration
@@ -51,18 +57,33 @@ logger = logging.getLogger(__name__)
 # Lifespan Context Manager
 # ============================================================================
 
+async def _load_engine() -> None:
+    """
+    Load the search engine before serving, so the first search does not stall on it.
+
+    Failures are logged rather than fatal: the engine is retried lazily on
+    the first search request.
+    """
+    try:
+        await asyncio.to_thread(get_engine)
+        logger.info("Search engine loaded")
+    except Exception as e:
+        logger.warning(f"Search engine not loaded at startup: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan manager for startup and shutdown events.
 
     Startup:
-        - Initialize database connection (PostgreSQL or SQLite)
-        - Connect to Redis cache if enabled
+        - Concurrently: initialize the database (PostgreSQL or SQLite),
+          connect to Redis if enabled, and warm the search engine singleton
+        - Pre-connect to Google's OAuth hosts in the background
 
     Shutdown:
-        - Close database connections
-        - Close Redis connection
+        - Close database and Redis connections concurrently
+        - Close the shared Google OAuth HTTP client
 
     Args:
         app: FastAPI application instance
@@ -74,24 +95,34 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting Thinkstruct API...")
     logger.info(f"Database type: {settings.database_type}")
 
-    # Initialize database connection
+    # Database init, Redis connect and engine loading are independent, so
+    # they run concurrently and startup waits only for the slowest one
     logger.info("Initializing database...")
-    await db.init_db()
-    logger.info("Database initialized successfully")
-
-    # Initialize Redis cache if enabled
     if settings.redis_enabled:
         logger.info("Connecting to Redis cache...")
-        await cache.connect()
     else:
         logger.info("Redis cache is disabled")
+    logger.info("Loading search engine...")
+    await asyncio.gather(db.init_db(), cache.connect(), _load_engine())
+    logger.info("Database, cache and search engine initialized")
+
+    # Pre-open TLS connections to Google so the first login skips the
+    # handshake; runs in the background so startup never waits on the network
+    oauth_warmup = None
+    if settings.is_oauth_configured():
+        oauth_warmup = asyncio.create_task(GoogleOAuth.warmup())
 
     yield  # Application runs here
 
     # ==================== Shutdown ====================
     logger.info("Shutting down...")
-    await db.close()
-    await cache.close()
+    results = await asyncio.gather(db.close(), cache.close(), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error during shutdown: {result}")
+    if oauth_warmup is not None:
+        oauth_warmup.cancel()
+    await GoogleOAuth.close()
     logger.info("Cleanup completed")
 
 
@@ -106,14 +137,24 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Gzip responses over 1 KB: a top_k=100 search result carries abstracts,
+# descriptions and claims as plain text that compresses several-fold.
+# Added before CORS so CORS stays the outermost middleware and answers
+# preflights without passing through compression.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS (Cross-Origin Resource Sharing) configuration
 # Allows frontend (localhost:3000) to make requests to backend (localhost:5000)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],  # Frontend URLs
     allow_credentials=True,  # Allow cookies for authentication
-    allow_methods=["*"],     # Allow all HTTP methods
-    allow_headers=["*"],     # Allow all headers
+    # Explicit lists (the methods and headers the routers and frontend
+    # actually use) instead of "*", which with credentials makes Starlette
+    # echo the request's method/headers back on every preflight
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,           # Browsers cache preflight responses for 24h
 )
 
 
@@ -126,7 +167,7 @@ app.include_router(invalidity_router)      # POST /api/search/invalidity
 app.include_router(infringement_router)    # POST /api/search/infringement
 app.include_router(patentability_router)   # POST /api/search/patentability
 app.include_router(patent_id_router)       # POST /api/search/by-patent-id
-app.include_router(stats_router)           # GET /api/stats, GET /api/health
+app.include_router(stats_router)           # GET /api/stats, GET /api/health, GET /api/health/pool
 
 # Authentication and history routers
 app.include_router(auth_router)            # /api/auth/* endpoints
@@ -137,7 +178,38 @@ app.include_router(history_router)         # /api/history/* endpoints
 # Root Route
 # ============================================================================
 
-@app.get("/")
+# The listing never changes, so it is serialized once at import and every
+# request (including frequent liveness probes) returns the same bytes
+_ROOT_BYTES = orjson.dumps({
+    "name": "Thinkstruct Patent Search API",
+    "version": "2.0.0",
+    "endpoints": {
+        "invalidity_search": "POST /api/search/invalidity",
+        "infringement_search": "POST /api/search/infringement",
+        "patentability_search": "POST /api/search/patentability",
+        "patent_id_search": "POST /api/search/by-patent-id",
+        "stats": "GET /api/stats",
+        "health": "GET /api/health",
+        "pool_health": "GET /api/health/pool",
+        "auth": {
+            "login": "GET /api/auth/login/google",
+            "callback": "GET /api/auth/callback/google",
+            "me": "GET /api/auth/me",
+            "logout": "POST /api/auth/logout",
+            "status": "GET /api/auth/status"
+        },
+        "history": {
+            "save": "POST /api/history",
+            "list": "GET /api/history",
+            "get": "GET /api/history/{id}",
+            "delete": "DELETE /api/history/{id}",
+            "clear": "DELETE /api/history"
+        }
+    }
+})
+
+
+@app.get("/", response_class=Response)
 async def root():
     """
     API root endpoint.
@@ -145,50 +217,6 @@ async def root():
     Returns API information and available endpoints for documentation.
 
     Returns:
-        dict: API name, version, and endpoint listing
+        Response: Pre-serialized JSON with API name, version, and endpoint listing
     """
-    return {
-        "name": "Thinkstruct Patent Search API",
-        "version": "2.0.0",
-        "endpoints": {
-            "invalidity_search": "POST /api/search/invalidity",
-            "infringement_search": "POST /api/search/infringement",
-            "patentability_search": "POST /api/search/patentability",
-            "patent_id_search": "POST /api/search/by-patent-id",
-            "stats": "GET /api/stats",
-            "health": "GET /api/health",
-            "auth": {
-                "login": "GET /api/auth/login/google",
-                "callback": "GET /api/auth/callback/google",
-                "me": "GET /api/auth/me",
-                "logout": "POST /api/auth/logout",
-                "status": "GET /api/auth/status"
-            },
-            "history": {
-                "save": "POST /api/history",
-                "list": "GET /api/history",
-                "get": "GET /api/history/{id}",
-                "delete": "DELETE /api/history/{id}",
-                "clear": "DELETE /api/history"
-            }
-        }
-    }
-
-
-# ============================================================================
-# Startup Entry Point
-# ============================================================================
-
-def start():
-    """
-    Start the server using uvicorn.
-
-    This function is called when running the module directly.
-    Uses hot-reload for development convenience.
-    """
-    import uvicorn
-    uvicorn.run("backend.main:app", host="0.0.0.0", port=5000, reload=True)
-
-
-if __name__ == "__main__":
-    start()
+    return Response(content=_ROOT_BYTES, media_type="application/json")
@@ -9,10 +9,27 @@ Models are organized by scenario:
 - Infringement Monitoring: Detect potential patent infringement
 - Patentability Review: Assess patentability of inventions
 - Patent ID Search: Search by patent document number
+
+Response models are frozen: routers build them from trusted engine output
+with model_construct(), skipping validation, and never mutate them after.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from datetime import date
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated, Optional
+
+
+# ============================================================================
+# Shared Field Types
+# ============================================================================
+
+# Declared once and reused by every request model, so each constraint is
+# defined in one place instead of being repeated per model
+TopK = Annotated[int, Field(ge=1, le=100, description="Maximum number of results to return")]
+Similarity = Annotated[float, Field(ge=0.0, le=1.0, description="Minimum similarity threshold (0-1)")]
+# Result lists are sliced by the engine (claims to 10, matches to 5); the
+# bound is declared here so the limit is part of the published schema
+ClaimList = Annotated[list[str], Field(max_length=10)]
 
 
 # ============================================================================
@@ -55,16 +72,11 @@ class InvaliditySearchRequest(BaseModel):
         default="",
         description="Filter by title substring match"
     )
-    target_date: Optional[str] = Field(
+    target_date: Optional[date] = Field(
         default=None,
         description="Only return patents before this date (YYYY-MM-DD)"
     )
-    top_k: int = Field(
-        default=20,
-        ge=1,
-        le=100,
-        description="Maximum number of results to return"
-    )
+    top_k: TopK = 20
 
 
 class InfringementSearchRequest(BaseModel):
@@ -104,26 +116,16 @@ class InfringementSearchRequest(BaseModel):
         default="",
         description="Filter by title substring match"
     )
-    date_from: Optional[str] = Field(
+    date_from: Optional[date] = Field(
         default=None,
         description="Only return patents after this date (YYYY-MM-DD)"
     )
-    date_to: Optional[str] = Field(
+    date_to: Optional[date] = Field(
         default=None,
         description="Only return patents before this date (YYYY-MM-DD)"
     )
-    min_similarity: float = Field(
-        default=0.5,
-        ge=0.0,
-        le=1.0,
-        description="Minimum similarity threshold (0-1)"
-    )
-    top_k: int = Field(
-        default=20,
-        ge=1,
-        le=100,
-        description="Maximum number of results to return"
-    )
+    min_similarity: Similarity = 0.5
+    top_k: TopK = 20
 
 
 class PatentabilitySearchRequest(BaseModel):
@@ -162,12 +164,7 @@ class PatentabilitySearchRequest(BaseModel):
         default="",
         description="Filter by title substring match"
     )
-    top_k: int = Field(
-        default=20,
-        ge=1,
-        le=100,
-        description="Maximum number of results to return"
-    )
+    top_k: TopK = 20
 
 
 class PatentIdSearchRequest(BaseModel):
@@ -193,18 +190,17 @@ class PatentIdSearchRequest(BaseModel):
         default="",
         description="IPC/CPC classification code prefix filter"
     )
-    top_k: int = Field(
-        default=20,
-        ge=1,
-        le=100,
-        description="Maximum number of results to return"
-    )
+    top_k: TopK = 20
 
 
 # ============================================================================
 # Response Models - Result Items
 # ============================================================================
 
+# Shared by all search response models: immutable, unknown fields dropped
+RESPONSE_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 class InvalidityResultItem(BaseModel):
     """
     Single result item for invalidity search.
@@ -212,16 +208,18 @@ class InvalidityResultItem(BaseModel):
     Contains patent information, similarity score, and matched claims
     that could be used to invalidate a target patent.
     """
+    model_config = RESPONSE_CONFIG
+
     doc_number: str               # Patent document number
     title: str                    # Patent title
     abstract: str                 # Patent abstract
     classification: str           # IPC/CPC classification code
     publication_date: str         # Publication date (YYYY-MM-DD)
     similarity_score: float       # Semantic similarity (0-1)
-    matched_claims: list[str]     # Claims matching the query
-    independent_claims: list[str] # Independent claims only
+    matched_claims: ClaimList     # Claims matching the query
+    independent_claims: ClaimList # Independent claims only
     claims_count: int             # Total number of claims
-    all_claims: list[str]         # All claims (up to 10)
+    all_claims: ClaimList         # All claims (up to 10)
     detailed_description: str     # Truncated description
 
 
@@ -232,6 +230,8 @@ class InfringementResultItem(BaseModel):
     Contains patent information, risk level assessment, and overlapping
     technical features that may indicate infringement.
     """
+    model_config = RESPONSE_CONFIG
+
     doc_number: str                  # Patent document number
     title: str                       # Patent title
     abstract: str                    # Patent abstract
@@ -239,9 +239,9 @@ class InfringementResultItem(BaseModel):
     publication_date: str            # Publication date (YYYY-MM-DD)
     similarity_score: float          # Semantic similarity (0-1)
     risk_level: str                  # Risk: Very High/High/Medium/Low
-    matched_claims: list[str]        # Claims matching your patent
-    overlapping_features: list[str]  # Technical features that overlap
-    all_claims: list[str]            # All claims (up to 10)
+    matched_claims: ClaimList        # Claims matching your patent
+    overlapping_features: ClaimList  # Technical features that overlap
+    all_claims: ClaimList            # All claims (up to 10)
     detailed_description: str        # Truncated description
 
 
@@ -252,6 +252,8 @@ class PatentabilityResultItem(BaseModel):
     Contains patent information, novelty assessment, and key differences
     from prior art that could support patentability.
     """
+    model_config = RESPONSE_CONFIG
+
     doc_number: str              # Patent document number
     title: str                   # Patent title
     abstract: str                # Patent abstract
@@ -260,10 +262,10 @@ class PatentabilityResultItem(BaseModel):
     similarity_score: float      # Semantic similarity (0-1)
     novelty_assessment: str      # Assessment: Novel/Similar/Identical
     closest_prior_art: bool      # True if this is the closest match
-    key_differences: list[str]   # Differences from prior art
-    matched_claims: list[str]    # Related claims from prior art
+    key_differences: ClaimList   # Differences from prior art
+    matched_claims: ClaimList    # Related claims from prior art
     technical_field: str         # Technical field name
-    all_claims: list[str]        # All claims (up to 10)
+    all_claims: ClaimList        # All claims (up to 10)
     detailed_description: str    # Truncated description
 
 
@@ -274,14 +276,16 @@ class PatentIdResultItem(BaseModel):
     Contains similar patent information found by searching
     using another patent as the query source.
     """
+    model_config = RESPONSE_CONFIG
+
     doc_number: str           # Patent document number
     title: str                # Patent title
     abstract: str             # Patent abstract
     classification: str       # IPC/CPC classification code
     publication_date: str     # Publication date (YYYY-MM-DD)
     similarity_score: float   # Semantic similarity (0-1)
-    matched_claims: list[str] # Claims matching the source patent
-    all_claims: list[str]     # All claims (up to 10)
+    matched_claims: ClaimList # Claims matching the source patent
+    all_claims: ClaimList     # All claims (up to 10)
     detailed_description: str # Truncated description
 
 
@@ -296,6 +300,8 @@ class InvaliditySearchResponse(BaseModel):
     Contains success status, result count, search results,
     and performance metrics.
     """
+    model_config = RESPONSE_CONFIG
+
     success: bool                        # Whether search succeeded
     total: int                           # Number of results returned
     results: list[InvalidityResultItem]  # List of matching patents
@@ -313,6 +319,8 @@ class InfringementSearchResponse(BaseModel):
     Contains success status, result count, search results
     with risk assessments, and performance metrics.
     """
+    model_config = RESPONSE_CONFIG
+
     success: bool                          # Whether search succeeded
     total: int                             # Number of results returned
     results: list[InfringementResultItem]  # List of potentially infringing patents
@@ -330,6 +338,8 @@ class PatentabilitySearchResponse(BaseModel):
     Contains success status, result count, prior art results
     with novelty assessments, and performance metrics.
     """
+    model_config = RESPONSE_CONFIG
+
     success: bool                           # Whether search succeeded
     total: int                              # Number of results returned
     results: list[PatentabilityResultItem]  # List of prior art patents
@@ -346,12 +356,14 @@ class SourcePatentInfo(BaseModel):
 
     Contains the patent details that was used as the search query.
     """
+    model_config = RESPONSE_CONFIG
+
     doc_number: str       # Patent document number
     title: str            # Patent title
     abstract: str         # Patent abstract
     classification: str   # IPC/CPC classification code
     publication_date: str # Publication date
-    claims: list[str]     # Patent claims
+    claims: ClaimList     # Patent claims
 
 
 class PatentIdSearchResponse(BaseModel):
@@ -361,6 +373,8 @@ class PatentIdSearchResponse(BaseModel):
     Contains the source patent information, similar patents found,
     and performance metrics.
     """
+    model_config = RESPONSE_CONFIG
+
     success: bool                                # Whether search succeeded
     source_patent: Optional[SourcePatentInfo] = None  # Source patent info
     total: int                                   # Number of results returned
@@ -5,6 +5,8 @@ from fastapi.responses import RedirectResponse
 
 from ..auth.config import settings
 from ..auth.database import db
+from ..auth.cache import cache
+from ..auth.session_store import session_store
 from ..auth.models import (
     User,
     UserResponse,
@@ -14,7 +16,7 @@ from ..auth.models import (
 )
 from ..auth.jwt_handler import JWTHandler
 from ..auth.oauth import GoogleOAuth
-from ..auth.dependencies import get_current_user, get_token_from_request
+from ..auth.dependencies import get_current_user, get_token_from_request, load_session_user
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -32,17 +34,16 @@ async def get_auth_status(
         if payload:
             session_id = payload.get("session_id")
             if session_id:
-                session = await db.get_session(session_id)
-                if session:
-                    user_data = await db.get_user_by_id(int(payload["sub"]))
-                    if user_data:
-                        user = UserResponse(
-                            id=user_data["id"],
-                            email=user_data["email"],
-                            name=user_data["name"],
-                            picture_url=user_data.get("picture_url"),
-                        )
-                        authenticated = True
+                user_data = await load_session_user(session_id, int(payload["sub"]))
+                if user_data:
+                    # Trusted DB/cache row: skip re-validation
+                    user = UserResponse.model_construct(
+                        id=user_data["id"],
+                        email=user_data["email"],
+                        name=user_data["name"],
+                        picture_url=user_data.get("picture_url"),
+                    )
+                    authenticated = True
 
     return AuthStatus(
         authenticated=authenticated,
@@ -81,20 +82,18 @@ async def callback_google(code: str, response: Response):
             status_code=302,
         )
 
-    # Create or update user
-    user_data = await db.upsert_user(
+    # Create or update user and open a session
+    user_data, session_id = await db.login_user(
         google_id=user_info.id,
         email=user_info.email,
         name=user_info.name,
         picture_url=user_info.picture,
-    )
-
-    # Create session
-    session_id = await db.create_session(
-        user_id=user_data["id"],
         expires_hours=settings.jwt_expiration_hours,
     )
 
+    # Warm session and user caches for subsequent requests
+    await cache.cache_login_bundle(session_id, user_data["id"], user_data)
+
     # Create JWT
     token = JWTHandler.create_token(
         user_id=user_data["id"],
@@ -121,7 +120,7 @@ async def callback_google(code: str, response: Response):
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(user: User = Depends(get_current_user)):
     """Get current user info."""
-    return UserResponse(
+    return UserResponse.model_construct(
         id=user.id,
         email=user.email,
         name=user.name,
@@ -136,11 +135,15 @@ async def logout(
     token: str = Depends(get_token_from_request),
 ):
     """Logout current user."""
-    # Revoke the session
-    if token:
-        session_id = JWTHandler.get_session_id_from_token(token)
+    # Revoke the session (get_current_user already verified this token,
+    # so verify_token answers from its cache)
+    payload = JWTHandler.verify_token(token) if token else None
+    if payload:
+        session_id = payload.get("session_id")
         if session_id:
             await db.revoke_session(session_id)
+            await cache.invalidate_session(session_id, user.id)
+            session_store.discard(session_id)
 
     # Clear the cookie
     response.delete_cookie("access_token")
@@ -155,5 +158,7 @@ async def logout_all_sessions(
 ):
     """Logout from all sessions."""
     await db.revoke_all_user_sessions(user.id)
+    await cache.invalidate_user_sessions(user.id, sweep=True)
+    session_store.discard_user(user.id)
     response.delete_cookie("access_token")
     return MessageResponse(message="Logged out from all sessions")
@@ -1,19 +1,42 @@
 """History router for search history management."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 
 from ..auth.database import db
 from ..auth.models import (
     User,
     SearchHistoryCreate,
     SearchHistoryResponse,
+    SearchHistoryBatchResponse,
     SearchHistoryListResponse,
     MessageResponse,
+    HISTORY_LIST_ADAPTER,
 )
 from ..auth.dependencies import get_current_user
 
 router = APIRouter(prefix="/api/history", tags=["history"])
 
+VALID_SCENARIOS = ["invalidity", "infringement", "patentability"]
+
+# Entries accepted per /batch request, so one call cannot push an unbounded
+# number of rows (each with its own results_data) into a single transaction
+MAX_BATCH_SIZE = 100
+
+# Single-entry responses below are built from our own database rows with
+# model_construct, which skips re-validating data that was validated on the
+# way in
+
+
+def _validate_scenario(scenario: str) -> None:
+    """Raise HTTP 400 if scenario is not one of VALID_SCENARIOS."""
+    if scenario not in VALID_SCENARIOS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid scenario. Must be one of: {', '.join(VALID_SCENARIOS)}",
+        )
+
 
 @router.post("", response_model=SearchHistoryResponse)
 async def save_search_history(
@@ -21,13 +44,7 @@ async def save_search_history(
     user: User = Depends(get_current_user),
 ):
     """Save a search to history."""
-    # Validate scenario
-    valid_scenarios = ["invalidity", "infringement", "patentability"]
-    if data.scenario not in valid_scenarios:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid scenario. Must be one of: {', '.join(valid_scenarios)}",
-        )
+    _validate_scenario(data.scenario)
 
     history_id = await db.save_search_history(
         user_id=user.id,
@@ -42,7 +59,7 @@ async def save_search_history(
     if not entry:
         raise HTTPException(status_code=500, detail="Failed to save history")
 
-    return SearchHistoryResponse(
+    return SearchHistoryResponse.model_construct(
         id=entry["id"],
         scenario=entry["scenario"],
         query_data=entry["query_data"],
@@ -53,33 +70,42 @@ async def save_search_history(
     )
 
 
+@router.post("/batch", response_model=SearchHistoryBatchResponse)
+async def save_search_history_batch(
+    data: Annotated[list[SearchHistoryCreate], Body(min_length=1, max_length=MAX_BATCH_SIZE)],
+    user: User = Depends(get_current_user),
+):
+    """Save several searches to history in one database round-trip."""
+    for item in data:
+        _validate_scenario(item.scenario)
+
+    ids = await db.save_search_history_bulk([
+        (user.id, item.scenario, item.query_data, item.results_data,
+         item.result_count, item.search_time_ms)
+        for item in data
+    ])
+    return SearchHistoryBatchResponse(ids=ids)
+
+
 @router.get("", response_model=SearchHistoryListResponse)
 async def get_search_history(
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    include_results: bool = Query(default=False),
     user: User = Depends(get_current_user),
 ):
-    """Get user's search history."""
+    """Get user's search history (results_data omitted unless include_results=true)."""
     entries = await db.get_search_history(
         user_id=user.id,
         limit=limit,
         offset=offset,
+        include_results=include_results,
     )
 
-    items = [
-        SearchHistoryResponse(
-            id=entry["id"],
-            scenario=entry["scenario"],
-            query_data=entry["query_data"],
-            results_data=entry.get("results_data"),
-            result_count=entry["result_count"],
-            search_time_ms=entry["search_time_ms"],
-            created_at=entry["created_at"],
-        )
-        for entry in entries
-    ]
+    # One batch validation in pydantic-core; extra row columns are ignored
+    items = HISTORY_LIST_ADAPTER.validate_python(entries)
 
-    return SearchHistoryListResponse(items=items, total=len(items))
+    return SearchHistoryListResponse.model_construct(items=items, total=len(items))
 
 
 @router.get("/{history_id}", response_model=SearchHistoryResponse)
@@ -92,7 +118,7 @@ async def get_history_entry(
     if not entry:
         raise HTTPException(status_code=404, detail="History entry not found")
 
-    return SearchHistoryResponse(
+    return SearchHistoryResponse.model_construct(
         id=entry["id"],
         scenario=entry["scenario"],
         query_data=entry["query_data"],
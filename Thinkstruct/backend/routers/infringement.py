@@ -67,22 +67,24 @@ async def infringement_search(request: InfringementSearchRequest, engine=Depends
         # Record start time for performance measurement
         start_time = time.perf_counter()
 
-        # Execute the search using the engine
+        # Execute the search using the engine (dates go back to ISO strings,
+        # which the engine compares against stored publication dates)
         results = engine.infringement_search(
             my_claims=request.my_claims,
             my_doc_number=request.my_doc_number,
             classification=request.classification,
             keywords=request.keywords,
             title_search=request.title_search,
-            date_from=request.date_from,
-            date_to=request.date_to,
+            date_from=request.date_from and request.date_from.isoformat(),
+            date_to=request.date_to and request.date_to.isoformat(),
             min_similarity=request.min_similarity,
             top_k=request.top_k
         )
 
         # Convert engine results to Pydantic response models
+        # (trusted engine output: model_construct skips re-validation)
         result_items = [
-            InfringementResultItem(
+            InfringementResultItem.model_construct(
                 doc_number=r.doc_number,
                 title=r.title,
                 abstract=r.abstract,
@@ -101,7 +103,7 @@ async def infringement_search(request: InfringementSearchRequest, engine=Depends
         # Calculate search time in milliseconds
         search_time_ms = (time.perf_counter() - start_time) * 1000
 
-        return InfringementSearchResponse(
+        return InfringementSearchResponse.model_construct(
             success=True,
             total=len(result_items),
             results=result_items,
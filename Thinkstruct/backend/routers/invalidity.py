@@ -58,20 +58,22 @@ async def invalidity_search(request: InvaliditySearchRequest, engine=Depends(get
         # Record start time for performance measurement
         start_time = time.perf_counter()
 
-        # Execute the search using the engine
+        # Execute the search using the engine (dates go back to ISO strings,
+        # which the engine compares against stored publication dates)
         results = engine.invalidity_search(
             query_claims=request.query_claims,
             query_doc_number=request.query_doc_number,
             classification=request.classification,
             keywords=request.keywords,
             title_search=request.title_search,
-            target_date=request.target_date,
+            target_date=request.target_date and request.target_date.isoformat(),
             top_k=request.top_k
         )
 
         # Convert engine results to Pydantic response models
+        # (trusted engine output: model_construct skips re-validation)
         result_items = [
-            InvalidityResultItem(
+            InvalidityResultItem.model_construct(
                 doc_number=r.doc_number,
                 title=r.title,
                 abstract=r.abstract,
@@ -90,7 +92,7 @@ async def invalidity_search(request: InvaliditySearchRequest, engine=Depends(get
         # Calculate search time in milliseconds
         search_time_ms = (time.perf_counter() - start_time) * 1000
 
-        return InvaliditySearchResponse(
+        return InvaliditySearchResponse.model_construct(
             success=True,
             total=len(result_items),
             results=result_items,
@@ -70,7 +70,7 @@ async def patent_id_search(request: PatentIdSearchRequest, engine=Depends(get_en
 
         # Handle case when patent is not found in database
         if source_patent is None:
-            return PatentIdSearchResponse(
+            return PatentIdSearchResponse.model_construct(
                 success=False,
                 source_patent=None,
                 total=0,
@@ -79,7 +79,7 @@ async def patent_id_search(request: PatentIdSearchRequest, engine=Depends(get_en
             )
 
         # Build source patent info for the response
-        source_info = SourcePatentInfo(
+        source_info = SourcePatentInfo.model_construct(
             doc_number=source_patent["doc_number"],
             title=source_patent["title"],
             abstract=source_patent["abstract"],
@@ -89,8 +89,9 @@ async def patent_id_search(request: PatentIdSearchRequest, engine=Depends(get_en
         )
 
         # Convert engine results to Pydantic response models
+        # (trusted engine output: model_construct skips re-validation)
         result_items = [
-            PatentIdResultItem(
+            PatentIdResultItem.model_construct(
                 doc_number=r.doc_number,
                 title=r.title,
                 abstract=r.abstract,
@@ -107,7 +108,7 @@ async def patent_id_search(request: PatentIdSearchRequest, engine=Depends(get_en
         # Calculate search time in milliseconds
         search_time_ms = (time.perf_counter() - start_time) * 1000
 
-        return PatentIdSearchResponse(
+        return PatentIdSearchResponse.model_construct(
             success=True,
             source_patent=source_info,
             total=len(result_items),
@@ -74,8 +74,9 @@ async def patentability_search(request: PatentabilitySearchRequest, engine=Depen
         )
 
         # Convert engine results to Pydantic response models
+        # (trusted engine output: model_construct skips re-validation)
         result_items = [
-            PatentabilityResultItem(
+            PatentabilityResultItem.model_construct(
                 doc_number=r.doc_number,
                 title=r.title,
                 abstract=r.abstract,
@@ -96,7 +97,7 @@ async def patentability_search(request: PatentabilitySearchRequest, engine=Depen
         # Calculate search time in milliseconds
         search_time_ms = (time.perf_counter() - start_time) * 1000
 
-        return PatentabilitySearchResponse(
+        return PatentabilitySearchResponse.model_construct(
             success=True,
             total=len(result_items),
             results=result_items,
@@ -5,6 +5,7 @@ This router handles system statistics and health check endpoints.
 
 Endpoints:
 - GET /api/health - Health check for load balancers/monitoring
+- GET /api/health/pool - Database connection pool statistics
 - GET /api/stats - Patent database statistics
 - GET /api/patent/{doc_number} - Get single patent by ID
 """
@@ -16,6 +17,7 @@ from typing import Optional
 
 from ..models import StatsResponse
 from ..dependencies import get_engine
+from ..auth.database import db
 
 # Create router with prefix and tags
 router = APIRouter(prefix="/api", tags=["stats"])
@@ -43,8 +45,12 @@ class PatentInfoResponse(BaseModel):
 # Endpoints
 # ============================================================================
 
+# Endpoints returning plain dicts declare a "-> dict" return type: FastAPI
+# then serializes straight to JSON bytes in pydantic-core, as it already
+# does for endpoints with a response_model, instead of json.dumps.
+
 @router.get("/health")
-async def health_check():
+async def health_check() -> dict:
     """
     Health check endpoint.
 
@@ -57,6 +63,20 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@router.get("/health/pool")
+async def pool_health() -> dict:
+    """
+    Database connection pool statistics.
+
+    Lets monitoring watch for pool exhaustion (in_use approaching size)
+    without touching the database.
+
+    Returns:
+        dict: Backend name plus size, idle and in_use connection counts
+    """
+    return db.pool_stats()
+
+
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(engine=Depends(get_engine)):
     """
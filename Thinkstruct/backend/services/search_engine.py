@@ -25,7 +25,10 @@ logger = logging.getLogger(__name__)
 # Data Classes - By Scenario
 # ============================================================================
 
-@dataclass
+# One result object is built per hit (up to top_k per search) and read once
+# by the router, so the classes are slotted: no per-instance __dict__.
+
+@dataclass(slots=True)
 class InvalidityResult:
     """
     Invalidity search result.
@@ -46,7 +49,7 @@ class InvalidityResult:
     detailed_description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class InfringementResult:
     """
     Infringement monitoring result.
@@ -67,7 +70,7 @@ class InfringementResult:
     detailed_description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PatentabilityResult:
     """
     Patentability review result.
@@ -90,7 +93,7 @@ class PatentabilityResult:
     detailed_description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class PatentIdSearchResult:
     """
     Patent ID search result.
@@ -53,6 +53,9 @@ export async function saveSearchHistory(
 
 /**
  * Get user's search history.
+ *
+ * List entries carry metadata and query_data only (results_data is null);
+ * use getHistoryEntry() to load an entry's saved results.
  */
 export async function getSearchHistory(
   limit: number = 50,
@@ -2,6 +2,7 @@ import './HistoryPage.css';
 import { useState, useEffect } from 'react';
 import {
   getSearchHistory,
+  getHistoryEntry,
   deleteHistoryEntry,
   formatHistoryDate,
   type SearchHistoryEntry
@@ -33,6 +34,15 @@ export function HistoryPage({ onBack }: HistoryPageProps) {
     loadHistory();
   }, []);
 
+  // The history list omits results_data; fetch the full entry for the detail view
+  const handleSelect = async (id: number) => {
+    try {
+      setSelectedEntry(await getHistoryEntry(id));
+    } catch (err) {
+      console.error('Failed to load history entry:', err);
+    }
+  };
+
   const handleDelete = async (id: number, e: React.MouseEvent) => {
     e.stopPropagation();
     try {
@@ -172,7 +182,7 @@ export function HistoryPage({ onBack }: HistoryPageProps) {
             <div
               key={entry.id}
               className="history-item"
-              onClick={() => setSelectedEntry(entry)}
+              onClick={() => handleSelect(entry.id)}
             >
               <div className="history-item-main">
                 <span className={`scenario-badge ${entry.scenario}`}>
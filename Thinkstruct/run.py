@@ -1,8 +1,129 @@
 #!/usr/bin/env python3
 """
 Thinkstruct Backend Entry Point
+
+    python run.py            # production: multiple workers, uvloop/httptools
+    python run.py --reload   # development: single process with hot-reload
+    python run.py --migrate  # create/migrate the database schema and exit
+    python run.py --cleanup  # purge expired sessions hourly until stopped
+
+The supervisor process only imports uvicorn and the settings module: the
+app is loaded by each worker from the "backend.main:app" import string, and
+the schema migration and the expired-session sweep run in child processes.
 """
-import uvicorn
+import os
+import subprocess
+import sys
 
-if __name__ == "__main__":
+
+def migrate():
+    """
+    Create and migrate the database schema once, then exit.
+
+    Run before starting workers that have RUN_MIGRATIONS=false, e.g. when
+    launching uvicorn with --workers directly.
+    """
+    import asyncio
+    from backend.auth.database import db
+    asyncio.run(db.migrate())
+
+
+def cleanup():
+    """
+    Purge expired sessions every SESSION_CLEANUP_INTERVAL seconds until stopped.
+
+    start() runs this in one child process next to workers that have
+    RUN_SESSION_CLEANUP=false; run it the same way when launching uvicorn
+    with --workers directly.
+    """
+    import asyncio
+    from backend.auth.database import db
+
+    async def sweep():
+        # init_db() starts the cleanup task; keep the loop alive for it
+        await db.init_db()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await db.close()
+
+    try:
+        asyncio.run(sweep())
+    except KeyboardInterrupt:
+        pass
+
+
+def dev():
+    """
+    Start a single-process development server with hot-reload.
+
+    The reloader restarts the server on every source change, which only
+    works with one worker process.
+    """
+    import uvicorn
     uvicorn.run("backend.main:app", host="0.0.0.0", port=5000, reload=True)
+
+
+def start():
+    """
+    Start the production server using uvicorn.
+
+    Runs WORKERS processes (default: one per CPU) so request handling
+    scales across cores; each worker loads its own copy of the search
+    engine. loop/http "auto" select uvloop and httptools when they are
+    installed (uvicorn[standard]) and fall back to asyncio/h11 otherwise.
+    HOST and PORT override the bind address. Use dev() for hot-reload,
+    which is incompatible with multiple workers.
+
+    The schema is migrated once, before the workers start, and the workers
+    inherit RUN_MIGRATIONS=false so their startups do not run the same DDL
+    concurrently. RUN_MIGRATIONS=false set anywhere the workers read
+    settings from (the environment, .env or the compiled env_cache) skips
+    the migration step entirely.
+
+    The hourly expired-session sweep likewise runs in exactly one place: a
+    "--cleanup" child process started after the migration and stopped when
+    uvicorn exits. The workers inherit RUN_SESSION_CLEANUP=false, and
+    RUN_SESSION_CLEANUP=false in the settings skips the sweep process too.
+    """
+    import uvicorn
+    # Same source as the workers' settings; importing config alone does not
+    # load the app or the rest of the auth package
+    from backend.auth.config import AuthSettings
+    settings = AuthSettings.from_env()
+    if settings.run_migrations:
+        if subprocess.run([sys.executable, __file__, "--migrate"]).returncode != 0:
+            sys.exit("Database migration failed, not starting workers")
+    os.environ["RUN_MIGRATIONS"] = "false"
+    sweeper = None
+    if settings.run_session_cleanup:
+        # The sweep needs a single connection, not a full worker-sized pool
+        sweeper = subprocess.Popen(
+            [sys.executable, __file__, "--cleanup"],
+            env={**os.environ, "PG_POOL_MIN": "1", "SQLITE_POOL_SIZE": "1"},
+        )
+    os.environ["RUN_SESSION_CLEANUP"] = "false"
+    try:
+        uvicorn.run(
+            "backend.main:app",
+            host=os.getenv("HOST", "0.0.0.0"),
+            port=int(os.getenv("PORT", "5000")),
+            workers=int(os.getenv("WORKERS", os.cpu_count() or 2)),
+            loop="auto",
+            http="auto",
+        )
+    finally:
+        if sweeper is not None:
+            sweeper.terminate()
+            sweeper.wait()
+
+
+if __name__ == "__main__":
+    if "--migrate" in sys.argv[1:]:
+        migrate()
+    elif "--cleanup" in sys.argv[1:]:
+        cleanup()
+    elif "--reload" in sys.argv[1:]:
+        dev()
+    else:
+        start()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Compile .env into a Python Module
+
+Reads the project's .env file once and writes backend/auth/env_cache.py
+containing the values as a literal dict. At startup, config.py imports
+that module (a plain .pyc load) instead of parsing .env with python-dotenv.
+
+Run as a build/deploy step, and re-run whenever .env changes - the compiled
+module takes precedence over .env while it exists:
+    python scripts/compile_env.py
+
+The generated file contains secrets and is git-ignored.
+"""
+
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ENV_PATH = PROJECT_ROOT / ".env"
+OUTPUT_PATH = PROJECT_ROOT / "backend" / "auth" / "env_cache.py"
+
+
+def main():
+    """Command line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile .env into backend/auth/env_cache.py")
+    parser.add_argument("--env", type=Path, default=ENV_PATH, help="Path to the .env file")
+    parser.add_argument("-o", "--output", type=Path, default=OUTPUT_PATH, help="Path of the module to write")
+    args = parser.parse_args()
+
+    if not args.env.exists():
+        parser.error(f".env file not found: {args.env}")
+
+    values = {k: v for k, v in dotenv_values(args.env).items() if v is not None}
+    lines = [
+        '"""Generated by scripts/compile_env.py from .env - do not edit or commit."""',
+        "",
+        "ENV = {",
+        *(f"    {key!r}: {value!r}," for key, value in sorted(values.items())),
+        "}",
+        "",
+    ]
+    args.output.write_text("\n".join(lines), encoding="utf-8")
+    print(f"Wrote {len(values)} variables to {args.output}")
+
+
+if __name__ == "__main__":
+    main()